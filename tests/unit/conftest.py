@@ -1,9 +1,98 @@
+import subprocess
+from typing import Dict, Iterator, Optional, Tuple
+
 import _pytest.logging
 import pytest
 
+import tmt.utils
 from tmt.log import Logger
+from tmt.utils import Path
+
+# Fixture repositories mimicking the upstream beakerlib libraries,
+# synthesized locally so that the beakerlib tests need no network
+# access: url -> (default branch, files with their content)
+BEAKERLIB_FIXTURE_REPOSITORIES: Dict[str, Tuple[str, Dict[str, str]]] = {
+    'https://github.com/beakerlib/openssl': (
+        'master', {
+            'certgen/main.fmf': 'require:\n  - openssl\n',
+            'rand/main.fmf': 'require:\n  - openssl\n',
+            }),
+    'https://github.com/beakerlib/httpd': (
+        'master', {
+            'http/main.fmf': (
+                'require:\n'
+                '  - httpd\n'
+                '  - lsof\n'
+                '  - mod_ssl\n'
+                '  - library(openssl/certgen)\n'
+                '  - library(openssl/rand)\n'),
+            }),
+    'https://github.com/beakerlib/example': (
+        'main', {
+            'file/main.fmf': 'summary: Example file library\n',
+            }),
+    'https://github.com/teemtee/tmt': (
+        'main', {
+            'main.fmf': 'summary: Test management tool\n',
+            }),
+    }
 
 
 @pytest.fixture(name='root_logger')
 def fixture_root_logger(caplog: _pytest.logging.LogCaptureFixture) -> Logger:
     return Logger.create(verbose=0, debug=0, quiet=False)
+
+
+def _create_repository(path: Path, branch: str, files: Dict[str, str]) -> None:
+    """ Synthesize a git repository with an fmf tree and given files """
+    path.mkdir()
+    (path / '.fmf').mkdir()
+    (path / '.fmf/version').write_text('1\n')
+    for filename, content in files.items():
+        filepath = path / filename
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        filepath.write_text(content)
+    for command in (
+            ['git', 'init', '--quiet'],
+            ['git', 'symbolic-ref', 'HEAD', f'refs/heads/{branch}'],
+            ['git', 'add', '-A'],
+            ['git', '-c', 'user.name=pytest', '-c', 'user.email=pytest@localhost',
+             'commit', '--quiet', '-m', 'Initial commit'],
+            ):
+        subprocess.run(command, cwd=path, check=True)
+
+
+@pytest.fixture(scope='session')
+def beakerlib_cache(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Dict[str, str]]:
+    """ Synthesize library repositories once, redirect fetches to them """
+    cache = tmp_path_factory.mktemp('beakerlib-cache')
+    mirrors: Dict[str, str] = {}
+    for url, (branch, files) in BEAKERLIB_FIXTURE_REPOSITORIES.items():
+        repository = cache / url.split('/')[-1]
+        _create_repository(repository, branch, files)
+        mirror = cache / f'{repository.name}.git'
+        subprocess.run(
+            ['git', 'clone', '--quiet', '--bare', str(repository), str(mirror)], check=True)
+        mirrors[url] = f'file://{mirror}'
+
+    original_git_clone = tmt.utils.git_clone
+
+    def cached_git_clone(
+            url: str,
+            destination: tmt.utils.Path,
+            common: tmt.utils.Common,
+            env: Optional[tmt.utils.EnvironmentType] = None,
+            shallow: bool = False) -> tmt.utils.CommandOutput:
+        try:
+            url = mirrors[url]
+        except KeyError:
+            # Unknown repositories resolve to a missing path so that
+            # fetch attempts fail fast instead of touching the network
+            if url.startswith('https://github.com/'):
+                url = f"file://{cache / 'missing.git'}"
+        return original_git_clone(url, destination, common, env=env, shallow=shallow)
+
+    monkeypatch = pytest.MonkeyPatch()
+    monkeypatch.setattr(tmt.utils, 'git_clone', cached_git_clone)
+    yield mirrors
+    monkeypatch.undo()
@@ -1,61 +1,94 @@
 import shutil
+import unittest.mock
 
 import pytest
 
 import tmt
 import tmt.base
-import tmt.beakerlib
 from tmt.utils import Path
 
+# Shared identifier literals, parsed just once for all the tests
+OPENSSL_CERTGEN = tmt.base.RequireSimple.from_spec('library(openssl/certgen)')
+HTTPD_HTTP = tmt.base.RequireSimple.from_spec('library(httpd/http)')
+WGET = tmt.base.RequireSimple.from_spec('wget')
+FOREST = tmt.base.RequireSimple.from_spec('forest')
 
-@pytest.mark.web
-def test_library(root_logger):
-    """ Fetch a beakerlib library with/without providing a parent """
+
+def _expected_dest(tmp_path):
+    """ Resolved default library destination under given tmp_path """
+    import tmt.beakerlib
+    return (tmp_path / tmt.beakerlib.DEFAULT_DESTINATION).resolve()
+
+
+@pytest.fixture(name='parent')
+def fixture_parent(root_logger, tmp_path, monkeypatch):
+    """ Parent common object with a workdir isolated in tmp_path """
+    monkeypatch.chdir(tmp_path)
     parent = tmt.utils.Common(logger=root_logger, workdir=True)
-    library_with_parent = tmt.beakerlib.Library(
-        logger=root_logger,
-        identifier=tmt.base.RequireSimple('library(openssl/certgen)'), parent=parent)
-    library_without_parent = tmt.beakerlib.Library(
+    yield parent
+    # The workdir lives under tmp_path, remove it early anyway so that
+    # failed tests do not pile up fetched repositories
+    shutil.rmtree(parent.workdir, ignore_errors=True)
+
+
+@pytest.mark.parametrize('with_parent', [True, False], ids=['with-parent', 'without-parent'])
+def test_library(with_parent, root_logger, beakerlib_cache, tmp_path, monkeypatch, request):
+    """ Fetch a beakerlib library with/without providing a parent """
+    import tmt.beakerlib
+    monkeypatch.chdir(tmp_path)
+    # The fixture takes care of removing the workdir of the parent
+    parent = request.getfixturevalue('parent') if with_parent else None
+    library = tmt.beakerlib.Library(
         logger=root_logger,
-        identifier=tmt.base.RequireSimple('library(openssl/certgen)'))
+        identifier=OPENSSL_CERTGEN, parent=parent)
 
-    for library in [library_with_parent, library_without_parent]:
+    try:
+        if with_parent:
+            assert library.parent is parent
+        else:
+            # A fresh parent is created when none is provided
+            assert library.parent is not None
         assert library.format == 'rpm'
         assert library.repo == Path('openssl')
         assert library.url == 'https://github.com/beakerlib/openssl'
         assert library.ref == 'master'  # The default branch is master
-        assert library.dest.resolve() \
-            == Path.cwd().joinpath(tmt.beakerlib.DEFAULT_DESTINATION).resolve()
-        shutil.rmtree(library.parent.workdir)
+        assert library.dest.resolve() == _expected_dest(tmp_path)
+    finally:
+        # Remove the workdir of the automatically created parent
+        if parent is None:
+            shutil.rmtree(library.parent.workdir, ignore_errors=True)
 
 
-@pytest.mark.web
 @pytest.mark.parametrize(
     'url, name, default_branch', [
         ('https://github.com/beakerlib/httpd', '/http', 'master'),
         ('https://github.com/beakerlib/example', '/file', 'main')
         ])
-def test_library_from_fmf(url, name, default_branch, root_logger):
+def test_library_from_fmf(url, name, default_branch, root_logger, beakerlib_cache,
+                          tmp_path, monkeypatch):
     """ Fetch beakerlib library referenced by fmf identifier """
+    import tmt.beakerlib
+    monkeypatch.chdir(tmp_path)
     library = tmt.beakerlib.Library(
         logger=root_logger,
         identifier=tmt.base.RequireFmfId(
             url=url,
             name=name))
-    assert library.format == 'fmf'
-    assert library.ref == default_branch
-    assert library.url == url
-    assert library.dest.resolve() \
-        == Path.cwd().joinpath(tmt.beakerlib.DEFAULT_DESTINATION).resolve()
-    assert library.repo == Path(url.split('/')[-1])
-    assert library.name == name
-    shutil.rmtree(library.parent.workdir)
-
-
-@pytest.mark.web
-def test_invalid_url_conflict(root_logger):
+    try:
+        assert library.format == 'fmf'
+        assert library.ref == default_branch
+        assert library.url == url
+        assert library.dest.resolve() == _expected_dest(tmp_path)
+        assert library.repo == Path(url.split('/')[-1])
+        assert library.name == name
+    finally:
+        # Remove the workdir of the automatically created parent
+        shutil.rmtree(library.parent.workdir, ignore_errors=True)
+
+
+def test_invalid_url_conflict(root_logger, beakerlib_cache, parent):
     """ Saner check if url mismatched for translated library """
-    parent = tmt.utils.Common(logger=root_logger, workdir=True)
+    import tmt.beakerlib
     # Fetch to cache 'tmt' repo
     tmt.beakerlib.Library(
         logger=root_logger,
@@ -69,36 +102,114 @@ def test_invalid_url_conflict(root_logger):
     # so there can't be "already fetched" error
     with pytest.raises(tmt.beakerlib.LibraryError):
         tmt.beakerlib.Library(logger=root_logger, identifier='library(tmt/foo)', parent=parent)
-    shutil.rmtree(parent.workdir)
 
 
-@pytest.mark.web
-def test_dependencies(root_logger):
-    """ Check requires for possible libraries """
-    parent = tmt.utils.Common(logger=root_logger, workdir=True)
-    requires, recommends, libraries = tmt.beakerlib.dependencies(
-        original_require=[
-            tmt.base.RequireSimple('library(httpd/http)'), tmt.base.RequireSimple('wget')],
-        original_recommend=[tmt.base.RequireSimple('forest')],
-        parent=parent,
-        logger=root_logger)
-    # Check for correct requires and recommends
-    for require in ['httpd', 'lsof', 'mod_ssl']:
-        assert require in requires
-        assert require in libraries[0].require
-    assert 'openssl' in libraries[2].require
-    assert 'forest' in recommends
+def test_shallow_fetch(root_logger, beakerlib_cache, parent, monkeypatch):
+    """ Force a shallow clone when fetching the library """
+    import tmt.beakerlib
+    monkeypatch.setenv('TMT_BEAKERLIB_SHALLOW', '1')
+    library = tmt.beakerlib.Library(
+        logger=root_logger,
+        identifier=tmt.base.RequireFmfId(
+            url='https://github.com/beakerlib/httpd',
+            name='/http',
+            ref='master'),
+        parent=parent)
+    assert library.ref == 'master'
+    directory = parent.workdir / library.dest / library.repo
+    assert (directory / '.git/shallow').exists()
+
+
+@pytest.fixture(scope='session', name='resolved_dependencies')
+def fixture_resolved_dependencies(beakerlib_cache):
+    """ Resolve the dependency graph just once for the assertion tests """
+    import tmt.beakerlib
+    logger = tmt.log.Logger.create(verbose=0, debug=0, quiet=False)
+    parent = tmt.utils.Common(logger=logger, workdir=True)
+    try:
+        yield tmt.beakerlib.dependencies(
+            original_require=[HTTPD_HTTP, WGET],
+            original_recommend=[FOREST],
+            parent=parent,
+            logger=logger)
+    finally:
+        shutil.rmtree(parent.workdir, ignore_errors=True)
+
+
+def _libraries_by_name(libraries):
+    """ Key gathered libraries by name, their order is not guaranteed """
+    return {str(library): library for library in libraries}
+
+
+def test_dependencies_requires(resolved_dependencies):
+    """ Check requires aggregated from the libraries """
+    requires, _, libraries = resolved_dependencies
+    http = _libraries_by_name(libraries)['httpd/http']
+    expected_requires = {'httpd', 'lsof', 'mod_ssl'}
+    assert expected_requires <= set(requires)
+    assert expected_requires <= set(http.require)
     assert 'wget' in requires
     # Library require should be in httpd requires but not in the final result
-    assert 'library(openssl/certgen)' in libraries[0].require
+    assert 'library(openssl/certgen)' in http.require
     assert 'library(openssl/certgen)' not in requires
-    # Check library attributes for sane values
-    assert libraries[0].repo == Path('httpd')
-    assert libraries[0].name == '/http'
-    assert libraries[0].url == 'https://github.com/beakerlib/httpd'
-    assert libraries[0].ref == 'master'  # The default branch is master
-    assert libraries[0].dest.resolve() == Path.cwd().joinpath(
-        tmt.beakerlib.DEFAULT_DESTINATION).resolve()
-    assert libraries[1].repo == Path('openssl')
-    assert libraries[1].name == '/certgen'
-    shutil.rmtree(parent.workdir)
+
+
+def test_dependencies_recommends(resolved_dependencies):
+    """ Check recommends aggregated from the libraries """
+    _, recommends, libraries = resolved_dependencies
+    rand = _libraries_by_name(libraries)['openssl/rand']
+    assert 'openssl' in rand.require
+    assert 'forest' in recommends
+
+
+def test_dependencies_library_attrs(resolved_dependencies):
+    """ Check library attributes for sane values """
+    import tmt.beakerlib
+    _, _, libraries = resolved_dependencies
+    libraries_by_name = _libraries_by_name(libraries)
+    http = libraries_by_name['httpd/http']
+    certgen = libraries_by_name['openssl/certgen']
+    assert http.repo == Path('httpd')
+    assert http.name == '/http'
+    assert http.url == 'https://github.com/beakerlib/httpd'
+    assert http.ref == 'master'  # The default branch is master
+    assert http.dest == Path(tmt.beakerlib.DEFAULT_DESTINATION)
+    assert certgen.repo == Path('openssl')
+    assert certgen.name == '/certgen'
+
+
+def test_dependencies_parallel(resolved_dependencies, root_logger, beakerlib_cache,
+                               parent, monkeypatch):
+    """ Parallel prefetch must resolve the very same dependencies """
+    import tmt.beakerlib
+    monkeypatch.setenv('TMT_BEAKERLIB_PARALLEL_FETCH', '1')
+    requires, recommends, libraries = tmt.beakerlib.dependencies(
+        original_require=[HTTPD_HTTP, WGET],
+        original_recommend=[FOREST],
+        parent=parent,
+        logger=root_logger)
+    expected_requires, expected_recommends, expected_libraries = resolved_dependencies
+    assert set(requires) == set(expected_requires)
+    assert set(recommends) == set(expected_recommends)
+    assert set(_libraries_by_name(libraries)) == set(_libraries_by_name(expected_libraries))
+
+
+def test_dependencies_memoized(root_logger, beakerlib_cache, parent):
+    """ Repeated resolution is served from the memoized cache """
+    import tmt.beakerlib
+    requires, recommends, _ = tmt.beakerlib.dependencies(
+        original_require=[HTTPD_HTTP, WGET],
+        original_recommend=[FOREST],
+        parent=parent,
+        logger=root_logger)
+    # The second resolution with the same parent re-walks no requires,
+    # only the top-level library is even looked up in the fetch cache
+    with unittest.mock.patch.object(tmt.beakerlib.Library, 'fetch') as mocked_fetch:
+        cached_requires, cached_recommends, _ = tmt.beakerlib.dependencies(
+            original_require=[HTTPD_HTTP, WGET],
+            original_recommend=[FOREST],
+            parent=parent,
+            logger=root_logger)
+    assert mocked_fetch.call_count == 1
+    assert set(cached_requires) == set(requires)
+    assert set(cached_recommends) == set(recommends)
@@ -3,6 +3,7 @@
 import copy
 import dataclasses
 import enum
+import functools
 import itertools
 import os
 import re
@@ -293,7 +294,10 @@ _RawAdjustRule = TypedDict(
 class RequireSimple(str):
     # ignore[override]: expected, we do want to accept and return more
     # specific types than those declared in superclass.
+    # Instances are immutable strings, memoize them so that repeated
+    # specs (common package requires) share a single interned instance.
     @classmethod
+    @functools.lru_cache(maxsize=1024)
     def from_spec(cls, spec: str) -> 'RequireSimple':
         return RequireSimple(spec)
 
@@ -883,10 +887,10 @@ class Test(Core, tmt.export.Exportable['Test']):
         self._update_metadata()
 
     @staticmethod
-    def overview(tree: 'Tree') -> None:
+    def overview(tree: 'Tree', nodes: Optional[List[fmf.Tree]] = None) -> None:
         """ Show overview of available tests """
         tests = [
-            style(str(test), fg='red') for test in tree.tests()]
+            style(str(test), fg='red') for test in tree.tests(nodes=nodes)]
         echo(style(
             'Found {}{}{}.'.format(
                 listed(tests, 'test'),
@@ -1358,10 +1362,10 @@ class Plan(Core, tmt.export.Exportable['Plan']):
         return tmt.utils.dict_to_yaml(content)
 
     @staticmethod
-    def overview(tree: 'Tree') -> None:
+    def overview(tree: 'Tree', nodes: Optional[List[fmf.Tree]] = None) -> None:
         """ Show overview of available plans """
         plans = [
-            style(str(plan), fg='red') for plan in tree.plans()]
+            style(str(plan), fg='red') for plan in tree.plans(nodes=nodes)]
         echo(style(
             'Found {}{}{}.'.format(
                 listed(plans, 'plan'),
@@ -1834,27 +1838,35 @@ class Story(Core, tmt.export.Exportable['Story']):
 
         return status
 
+    # Cached coverage signature, computed on first match
+    _coverage_signature: Optional[Tuple[bool, bool, bool]] = None
+
     def _match(
             self, implemented: bool, verified: bool, documented: bool, covered: bool,
             unimplemented: bool, unverified: bool, undocumented: bool, uncovered: bool) -> bool:
         """ Return true if story matches given conditions """
-        if implemented and not self.implemented:
+        # The link properties scan the story links on every access, so
+        # pack their values into a signature computed once per story
+        if self._coverage_signature is None:
+            self._coverage_signature = (
+                bool(self.implemented), bool(self.verified), bool(self.documented))
+        is_implemented, is_verified, is_documented = self._coverage_signature
+        is_covered = is_implemented and is_verified and is_documented
+        if implemented and not is_implemented:
             return False
-        if verified and not self.verified:
+        if verified and not is_verified:
             return False
-        if documented and not self.documented:
+        if documented and not is_documented:
             return False
-        if unimplemented and self.implemented:
+        if unimplemented and is_implemented:
             return False
-        if unverified and self.verified:
+        if unverified and is_verified:
             return False
-        if undocumented and self.documented:
+        if undocumented and is_documented:
             return False
-        if uncovered and (
-                self.implemented and self.verified and self.documented):
+        if uncovered and is_covered:
             return False
-        if covered and not (
-                self.implemented and self.verified and self.documented):
+        if covered and not is_covered:
             return False
         return True
 
@@ -1888,10 +1900,10 @@ class Story(Core, tmt.export.Exportable['Story']):
             name='story', dry=dry, force=force)
 
     @staticmethod
-    def overview(tree: 'Tree') -> None:
+    def overview(tree: 'Tree', nodes: Optional[List[fmf.Tree]] = None) -> None:
         """ Show overview of available stories """
         stories = [
-            style(str(story), fg='red') for story in tree.stories()]
+            style(str(story), fg='red') for story in tree.stories(nodes=nodes)]
         echo(style(
             'Found {}{}{}.'.format(
                 listed(stories, 'story'),
@@ -2021,6 +2033,8 @@ class Tree(tmt.utils.Common):
             excludes: List[str]) -> List[CoreT]:
         """ Apply filters and conditions, return pruned nodes """
         result = []
+        # Compile exclude expressions just once, not for every node
+        exclude_patterns = [re.compile(expr) for expr in excludes]
         for node in nodes:
             filter_vars = copy.deepcopy(node._metadata)
             cond_vars = node._metadata
@@ -2058,7 +2072,7 @@ class Tree(tmt.utils.Common):
                 # Handle broken link as not matching
                 continue
             # Exclude
-            if any(node for expr in excludes if re.search(expr, node.name)):
+            if any(node for pattern in exclude_patterns if pattern.search(node.name)):
                 continue
             result.append(node)
         return result
@@ -2108,9 +2122,16 @@ class Tree(tmt.utils.Common):
             conditions: Optional[List[str]] = None,
             unique: bool = True,
             links: Optional[List['LinkNeedle']] = None,
-            excludes: Optional[List[str]] = None
+            excludes: Optional[List[str]] = None,
+            nodes: Optional[List[fmf.Tree]] = None
             ) -> List[Test]:
-        """ Search available tests """
+        """
+        Search available tests
+
+        When ``nodes`` are provided, use them instead of pruning the
+        tree again, e.g. when the caller already walked and classified
+        the nodes (see :py:func:`overview_all`).
+        """
         # Handle defaults, apply possible command line options
         logger = logger or self._logger
         keys = (keys or []) + ['test']
@@ -2165,13 +2186,15 @@ class Tree(tmt.utils.Common):
                     tests.extend(sorted(selected_tests, key=lambda test: test.order))
             # Otherwise just perform a regular key/name filtering
             else:
+                selected_nodes = nodes if nodes is not None \
+                    else self.tree.prune(keys=keys, names=names)
                 selected_tests = [
                     Test(
                         node=test,
                         logger=logger.descend(
                             logger_name=test.get('name', None)
                             )  # .apply_verbosity_options(**self._options),
-                        ) for test in name_filter(self.tree.prune(keys=keys, names=names))]
+                        ) for test in name_filter(selected_nodes)]
                 tests = sorted(selected_tests, key=lambda test: test.order)
 
         # Apply filters & conditions
@@ -2187,9 +2210,16 @@ class Tree(tmt.utils.Common):
             conditions: Optional[List[str]] = None,
             run: Optional['Run'] = None,
             links: Optional[List['LinkNeedle']] = None,
-            excludes: Optional[List[str]] = None
+            excludes: Optional[List[str]] = None,
+            nodes: Optional[List[fmf.Tree]] = None
             ) -> List[Plan]:
-        """ Search available plans """
+        """
+        Search available plans
+
+        When ``nodes`` are provided, use them instead of pruning the
+        tree again, e.g. when the caller already walked and classified
+        the nodes (see :py:func:`overview_all`).
+        """
         # Handle defaults, apply possible command line options
         logger = logger or (run._logger if run is not None else self._logger)
         local_plan_keys = (keys or []) + ['execute']
@@ -2228,18 +2258,19 @@ class Tree(tmt.utils.Common):
                     logger_name=plan.get('name', None),
                     extra_shift=0
                     ).apply_verbosity_options(**Plan._options),
-                run=run) for plan in [
-                *
-                self.tree.prune(
-                    keys=local_plan_keys,
-                    names=names,
-                    sources=sources),
-                *
-                self.tree.prune(
-                    keys=remote_plan_keys,
-                    names=names,
-                    sources=sources),
-                ]]
+                run=run) for plan in (
+                nodes if nodes is not None else [
+                    *
+                    self.tree.prune(
+                        keys=local_plan_keys,
+                        names=names,
+                        sources=sources),
+                    *
+                    self.tree.prune(
+                        keys=remote_plan_keys,
+                        names=names,
+                        sources=sources),
+                    ])]
 
         plans = self._filters_conditions(
             sorted(plans, key=lambda plan: plan.order),
@@ -2258,9 +2289,16 @@ class Tree(tmt.utils.Common):
             conditions: Optional[List[str]] = None,
             whole: bool = False,
             links: Optional[List['LinkNeedle']] = None,
-            excludes: Optional[List[str]] = None
+            excludes: Optional[List[str]] = None,
+            nodes: Optional[List[fmf.Tree]] = None
             ) -> List[Story]:
-        """ Search available stories """
+        """
+        Search available stories
+
+        When ``nodes`` are provided, use them instead of pruning the
+        tree again, e.g. when the caller already walked and classified
+        the nodes (see :py:func:`overview_all`).
+        """
         # Handle defaults, apply possible command line options
         logger = logger or self._logger
         keys = (keys or []) + ['story']
@@ -2289,11 +2327,16 @@ class Tree(tmt.utils.Common):
             names = None
         else:
             sources = None
+            # Compile the name patterns just once, the search in prune()
+            # would otherwise consult the regex cache for every node,
+            # re.search() accepts compiled patterns as well
+            names = [re.compile(name) for name in names]  # type: ignore[misc]
 
         # Build the list, convert to objects, sort and filter
+        story_nodes = nodes if nodes is not None \
+            else self.tree.prune(keys=keys, names=names, whole=whole, sources=sources)
         stories = [
-            Story(node=story, logger=logger.descend()) for story
-            in self.tree.prune(keys=keys, names=names, whole=whole, sources=sources)]
+            Story(node=story, logger=logger.descend()) for story in story_nodes]
         return self._filters_conditions(
             sorted(stories, key=lambda story: story.order),
             filters, conditions, links, excludes)
@@ -2362,6 +2405,33 @@ class Tree(tmt.utils.Common):
             tmt.Story.create('/stories/example', 'full', path, force, dry)
 
 
+def overview_all(tree: Tree) -> None:
+    """
+    Show overview of available tests, plans and stories
+
+    Walk the metadata tree just once, classify each node by its
+    distinguishing key and hand the buckets over to the individual
+    overviews, instead of three independent tree walks.
+    """
+    test_nodes: List[fmf.Tree] = []
+    plan_nodes: List[fmf.Tree] = []
+    remote_plan_nodes: List[fmf.Tree] = []
+    story_nodes: List[fmf.Tree] = []
+    for node in tree.tree.prune():
+        if 'test' in node.data:
+            test_nodes.append(node)
+        if 'execute' in node.data:
+            plan_nodes.append(node)
+        if 'plan' in node.data:
+            remote_plan_nodes.append(node)
+        if 'story' in node.data:
+            story_nodes.append(node)
+    Test.overview(tree, nodes=test_nodes)
+    # Local plans go first, remote plans after them, just like plans() does
+    Plan.overview(tree, nodes=plan_nodes + remote_plan_nodes)
+    Story.overview(tree, nodes=story_nodes)
+
+
 @dataclasses.dataclass
 class RunData(tmt.utils.SerializableContainer):
     root: Optional[str]
@@ -1,5 +1,6 @@
 """ Handle BeakerLib Libraries """
 
+import concurrent.futures
 import os
 import re
 import shutil
@@ -39,6 +40,7 @@ STRIP_SUFFIX_FORGES = [
 
 class CommonWithLibraryCache(tmt.utils.Common):
     _library_cache: Dict[str, 'Library']
+    _dependencies_cache: Dict[str, 'LibraryDependenciesType']
 
 
 class LibraryError(Exception):
@@ -180,6 +182,23 @@ class Library:
 
         return cast(CommonWithLibraryCache, self.parent)._library_cache
 
+    def _checkout_ref(self, directory: Path) -> None:
+        """ Check out the requested ref, deepen a shallow clone if needed """
+        assert self.ref is not None
+        try:
+            self.parent.run(Command('git', 'checkout', self.ref), cwd=directory)
+        except tmt.utils.RunError:
+            # The ref may not be reachable in a shallow clone, fetch
+            # the full history including other branches and retry once
+            if not (directory / '.git/shallow').exists():
+                raise
+            self.parent.run(
+                Command(
+                    'git', 'fetch', '--unshallow', 'origin',
+                    '+refs/heads/*:refs/remotes/origin/*'),
+                cwd=directory)
+            self.parent.run(Command('git', 'checkout', self.ref), cwd=directory)
+
     def fetch(self) -> None:
         """ Fetch the library (unless already fetched) """
         # Check if the library was already fetched
@@ -221,10 +240,14 @@ class Library:
             # Clone repo with disabled prompt to ignore missing/private repos
             try:
                 if self.url:
-                    # Shallow clone to speed up testing and
-                    # minimize data transfers if ref is not provided
+                    # Shallow clone to speed up testing and minimize
+                    # data transfers if ref is not provided, force it
+                    # when TMT_BEAKERLIB_SHALLOW is set in the
+                    # environment
+                    shallow = self.ref is None or bool(
+                        os.environ.get('TMT_BEAKERLIB_SHALLOW'))
                     tmt.utils.git_clone(self.url, directory, self.parent,
-                                        env={"GIT_ASKPASS": "echo"}, shallow=self.ref is None)
+                                        env={"GIT_ASKPASS": "echo"}, shallow=shallow)
                 else:
                     # Either url or path must be defined
                     assert self.path is not None
@@ -253,7 +276,7 @@ class Library:
             # Check out the requested branch
             try:
                 if self.ref is not None:
-                    self.parent.run(Command('git', 'checkout', self.ref), cwd=directory)
+                    self._checkout_ref(directory)
             except tmt.utils.RunError:
                 # Fallback to install during the prepare step if in rpm format
                 if self.format == 'rpm':
@@ -299,6 +322,45 @@ class Library:
                     f"for a deep library ({error}).")
 
 
+def _prefetch_libraries(
+        identifiers: List[tmt.base.Require],
+        parent: tmt.utils.Common,
+        logger: tmt.log.Logger) -> None:
+    """
+    Fetch distinct top-level libraries concurrently
+
+    Each clone is a blocking network operation, fetching independent
+    repositories in parallel overlaps their latencies. Only simple
+    'library(repo/lib)' identifiers are prefetched, at most one per
+    repository, and repositories already present in the parent's cache
+    are skipped. All errors are ignored here, the regular sequential
+    pass reports them with full context.
+    """
+    to_prefetch: Dict[str, BeakerlibIdentifierType] = {}
+    cached = getattr(parent, '_library_cache', {})
+    for identifier in identifiers:
+        if not isinstance(identifier, tmt.base.RequireSimple):
+            continue
+        matched = LIBRARY_REGEXP.search(identifier)
+        if not matched:
+            continue
+        repository = matched.groups()[0]
+        if repository not in cached:
+            to_prefetch.setdefault(repository, identifier)
+    if len(to_prefetch) < 2:
+        return
+
+    def fetch(identifier: BeakerlibIdentifierType) -> None:
+        try:
+            Library(logger=logger, identifier=identifier, parent=parent)
+        except (LibraryError, tmt.utils.GeneralError):
+            pass
+
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(8, len(to_prefetch))) as executor:
+        list(executor.map(fetch, to_prefetch.values()))
+
+
 def dependencies(
         *,
         original_require: List[tmt.base.Require],
@@ -317,15 +379,30 @@ def dependencies(
 
     Avoid infinite recursion by keeping track of imported library identifiers
     and not trying to fetch those again.
+
+    Results of the transitive require resolution are memoized in the
+    parent (next to the library cache) so that repeated calls sharing
+    the same parent do not re-walk requires of already resolved
+    libraries.
     """
     # Initialize lists, use set for require & recommend
     processed_require = set()
     processed_recommend = set()
     imported_lib_ids = imported_lib_ids or []
-    gathered_libraries = []
+    # Index gathered libraries by name for O(1) dedup, insertion order
+    # is preserved for the returned list
+    gathered_libraries: Dict[str, 'Library'] = {}
     original_require = original_require or []
     original_recommend = original_recommend or []
 
+    # Initialize the dependencies cache (indexed by the library name)
+    # FIXME: cast() - https://github.com/teemtee/tmt/issues/1372
+    dependencies_cache: Dict[str, LibraryDependenciesType] = {}
+    if parent is not None:
+        if not hasattr(parent, '_dependencies_cache'):
+            cast(CommonWithLibraryCache, parent)._dependencies_cache = {}
+        dependencies_cache = cast(CommonWithLibraryCache, parent)._dependencies_cache
+
     # Cut circular dependencies to avoid infinite recursion
     def already_fetched(lib: BeakerlibIdentifierType) -> bool:
         if not imported_lib_ids:
@@ -333,22 +410,33 @@ def dependencies(
         return lib not in imported_lib_ids
 
     to_fetch = original_require + original_recommend
+
+    # Optionally overlap the initial clones of independent libraries
+    if parent is not None and os.environ.get('TMT_BEAKERLIB_PARALLEL_FETCH'):
+        _prefetch_libraries(to_fetch, parent, logger)
+
     for dependency in filter(already_fetched, to_fetch):
         # Library require/recommend
         try:
             library = Library(logger=logger, identifier=dependency, parent=parent)
-            gathered_libraries.append(library)
+            gathered_libraries.setdefault(str(library), library)
             imported_lib_ids.append(library.identifier)
-            # Recursively check for possible dependent libraries
-            requires, recommends, libraries = dependencies(
-                original_require=library.require,
-                original_recommend=library.recommend,
-                parent=parent,
-                imported_lib_ids=imported_lib_ids,
-                logger=logger)
+            # Recursively check for possible dependent libraries,
+            # reuse memoized results for already resolved libraries
+            try:
+                requires, recommends, libraries = dependencies_cache[str(library)]
+            except KeyError:
+                requires, recommends, libraries = dependencies(
+                    original_require=library.require,
+                    original_recommend=library.recommend,
+                    parent=parent,
+                    imported_lib_ids=imported_lib_ids,
+                    logger=logger)
+                dependencies_cache[str(library)] = (requires, recommends, libraries)
             processed_require.update(set(requires))
             processed_recommend.update(set(recommends))
-            gathered_libraries.extend(libraries)
+            for gathered in libraries:
+                gathered_libraries.setdefault(str(gathered), gathered)
         # Regular package require/recommend
         except LibraryError:
             if dependency in original_require:
@@ -357,4 +445,4 @@ def dependencies(
                 processed_recommend.add(dependency)
 
     # Convert to list and return the results
-    return list(processed_require), list(processed_recommend), gathered_libraries
+    return list(processed_require), list(processed_recommend), list(gathered_libraries.values())
@@ -3,10 +3,18 @@
 """ Command line interface for the Test Management Tool """
 
 import collections
+import concurrent.futures
+import contextlib
 import dataclasses
+import functools
+import io
+import os
+import stat
 import subprocess
 import sys
-from typing import TYPE_CHECKING, Any, DefaultDict, List, Optional, Set
+import threading
+from typing import (TYPE_CHECKING, Any, Callable, DefaultDict, Dict, Iterator,
+                    List, Optional, Set, TextIO, cast)
 
 import click
 import fmf
@@ -15,9 +23,6 @@ from fmf.utils import listed
 
 import tmt
 import tmt.base
-import tmt.convert
-import tmt.export
-import tmt.identifier
 import tmt.log
 import tmt.options
 import tmt.plugins
@@ -51,15 +56,42 @@ class ContextObject:
     """
 
     logger: tmt.log.Logger
-    common: tmt.utils.Common
     fmf_context: tmt.utils.FmfContextType
     tree: tmt.Tree
     steps: Set[str] = dataclasses.field(default_factory=set)
     clean: Optional[tmt.Clean] = None
     clean_logger: Optional[tmt.log.Logger] = None
-    clean_partials: DefaultDict[str, List[tmt.base.CleanCallback]] = dataclasses.field(
-        default_factory=lambda: collections.defaultdict(list))
     run: Optional[tmt.Run] = None
+    # Cache for tree lookups, see _filtered_tests and _filtered_plans
+    tree_cache: Dict[Any, List[Any]] = dataclasses.field(default_factory=dict)
+    # Lazily created bits and pieces, see the properties below
+    _common: Optional[tmt.utils.Common] = None
+    _clean_partials: Optional[DefaultDict[str, List[tmt.base.CleanCallback]]] = None
+    # Cache for per-phase clean loggers, see clean_logger_for
+    _clean_loggers: Dict[str, tmt.log.Logger] = dataclasses.field(default_factory=dict)
+
+    @property
+    def common(self) -> tmt.utils.Common:
+        """ Common object for logging, created on first access """
+        if self._common is None:
+            self._common = tmt.utils.Common(logger=self.logger)
+        return self._common
+
+    @property
+    def clean_partials(self) -> DefaultDict[str, List[tmt.base.CleanCallback]]:
+        """ Clean callbacks, created on first access """
+        if self._clean_partials is None:
+            self._clean_partials = collections.defaultdict(list)
+        return self._clean_partials
+
+    def clean_logger_for(self, phase_name: str, **kwargs: Any) -> tmt.log.Logger:
+        """ Logger for a clean phase, descended just once per phase name """
+        if phase_name not in self._clean_loggers:
+            assert self.clean_logger is not None  # narrow type
+            self._clean_loggers[phase_name] = self.clean_logger \
+                .descend(logger_name=phase_name, extra_shift=0) \
+                .apply_verbosity_options(**kwargs)
+        return self._clean_loggers[phase_name]
 
 
 class Context(click.Context):
@@ -82,18 +114,221 @@ class Context(click.Context):
     obj: ContextObject
 
 
+@functools.lru_cache(maxsize=64)
+def _path(raw_path: str) -> Path:
+    """
+    Convert a string into Path, remembering recent conversions
+
+    Path construction parses and normalizes the string, which shows up
+    in tight scripted invocations; the few paths given on the command
+    line repeat, and Path instances are immutable, thus safe to share.
+    """
+    return Path(raw_path)
+
+
+@functools.lru_cache(maxsize=None)
+def _fmf_tree_root(path: Path) -> Path:
+    """ Memoized lookup of the fmf tree root above the given directory """
+    # Look for the '.fmf/version' marker so that finding the root does
+    # not require parsing the whole metadata tree
+    for directory in [path, *path.parents]:
+        if (directory / '.fmf/version').is_file():
+            return directory
+    # Fall back to fmf for exotic layouts (and its error reporting)
+    return Path(fmf.Tree(str(path)).root)
+
+
+def _filter_cache_key(kind: str, context: 'Context') -> Any:
+    """ Cache key built from the filtering parameters """
+    return (kind, repr(sorted(context.params.items())))
+
+
+def _filtered_tests(context: 'Context') -> List[tmt.Test]:
+    """ Tree tests, reusing results for identical filter parameters """
+    key = _filter_cache_key('tests', context)
+    if key not in context.obj.tree_cache:
+        context.obj.tree_cache[key] = context.obj.tree.tests()
+    return context.obj.tree_cache[key]
+
+
+def _filtered_plans(context: 'Context') -> List[tmt.Plan]:
+    """ Tree plans, reusing results for identical filter parameters """
+    key = _filter_cache_key('plans', context)
+    if key not in context.obj.tree_cache:
+        context.obj.tree_cache[key] = context.obj.tree.plans()
+    return context.obj.tree_cache[key]
+
+
+def _filtered_stories(context: 'Context') -> List[tmt.Story]:
+    """ Tree stories, reusing results for identical filter parameters """
+    key = _filter_cache_key('stories', context)
+    if key not in context.obj.tree_cache:
+        context.obj.tree_cache[key] = context.obj.tree.stories()
+    return context.obj.tree_cache[key]
+
+
+@contextlib.contextmanager
+def _buffered_output() -> Iterator[None]:
+    """
+    Buffer standard output for the duration of the block
+
+    Every echo() call writes and flushes the stream right away, which
+    gets flush-bound when listing thousands of objects. Collect the
+    output into a single buffer and write it out in one go instead.
+    """
+    original = sys.stdout
+    buffer = _OutputBuffer(original)
+    sys.stdout = buffer
+    try:
+        yield
+    finally:
+        sys.stdout = original
+        original.write(buffer.getvalue())
+        original.flush()
+
+
+class _OutputBuffer(io.StringIO):
+    """
+    Buffer which mimics terminalness of the stream it stands in for
+
+    Echo strips ansi colors based on the target stream, so the buffer
+    must answer isatty() the same way as the real output stream.
+    """
+
+    def __init__(self, original: TextIO) -> None:
+        super().__init__()
+        self._original = original
+
+    def isatty(self) -> bool:
+        return self._original.isatty()
+
+
+class _ThreadBufferedStdout(io.TextIOBase):
+    """
+    Standard output proxy dispatching writes to per-thread buffers
+
+    Threads which called register() write into their own buffer, all
+    other writes go straight to the original stream.
+    """
+
+    def __init__(self, original: TextIO) -> None:
+        self.original = original
+        self._local = threading.local()
+
+    def register(self) -> io.StringIO:
+        """ Buffer all writes of the current thread """
+        buffer = io.StringIO()
+        self._local.buffer = buffer
+        return buffer
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer or self.original).write(text)
+
+    def flush(self) -> None:
+        buffer = getattr(self._local, 'buffer', None)
+        (buffer or self.original).flush()
+
+
+def _lint_objects(objects: List[Any], jobs: int) -> int:
+    """
+    Lint given tests, plans or stories, return the exit code
+
+    With more jobs requested objects are checked in a thread pool, the
+    output of each lint is buffered and printed in the original order
+    once all checks finish.
+    """
+    exit_code = 0
+    if jobs < 2 or len(objects) < 2:
+        for obj in objects:
+            if not obj.lint():
+                exit_code = 1
+            echo()
+        return exit_code
+
+    proxy = _ThreadBufferedStdout(sys.stdout)
+
+    def lint_one(obj: Any) -> Any:
+        buffer = proxy.register()
+        return obj.lint(), buffer.getvalue()
+
+    sys.stdout = proxy
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(lint_one, objects))
+    finally:
+        sys.stdout = proxy.original
+    for ok, output in results:
+        if not ok:
+            exit_code = 1
+        sys.stdout.write(output)
+        echo()
+    return exit_code
+
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 #  Custom Group
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+# Click 8 fixed the propagation of parameters into context.params, see
+# https://github.com/pallets/click/pull/1840, and renamed the result
+# callback decorator. Detect it once through the renamed decorator -
+# in click 7 'result_callback' is a plain instance attribute - so that
+# commands do not re-apply click 7 workarounds on every invocation.
+_CLICK_GE_8 = callable(getattr(click.Group, 'result_callback', None))
+
+
+# Backward-compatible aliases accepted instead of the real command names
+COMMAND_ALIASES = {
+    # The 'test convert' alias (just temporary for now FIXME)
+    'convert': 'import',
+    # Support both story & stories
+    'story': 'stories',
+    }
+
+
 class CustomGroup(click.Group):
     """ Custom Click Group """
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Prefix index for command shortening, built on first lookup
+        self._prefix_index: Optional[Dict[str, List[str]]] = None
+        # Factories providing commands lazily, see add_command_factory
+        self._command_factories: Dict[str, Callable[[], click.Command]] = {}
+        # Names in registration order, including not yet built commands
+        self._command_order: List[str] = []
+
+    def add_command(self, cmd: click.Command, name: Optional[str] = None) -> None:
+        super().add_command(cmd, name)
+        command_name = name or cmd.name
+        assert command_name is not None  # narrow type
+        if command_name not in self._command_order:
+            self._command_order.append(command_name)
+        self._prefix_index = None
+
+    def add_command_factory(
+            self, name: str, factory: Callable[[], click.Command]) -> None:
+        """
+        Register a command to be built on first use of the group
+
+        Building a command may be expensive, e.g. step commands
+        construct a click command for every supported method, so defer
+        the work until this group actually dispatches the command or
+        needs its help text. Unrelated invocations then skip it
+        completely. The name reserves the command's place in the
+        listing order right away.
+        """
+        self._command_factories[name] = factory
+        if name not in self._command_order:
+            self._command_order.append(name)
+        self._prefix_index = None
+
     # ignore[override]: expected, we want to use more specific `Context`
     # type than the one declared in superclass.
     def list_commands(self, context: Context) -> List[str]:  # type: ignore[override]
         """ Prevent alphabetical sorting """
-        return list(self.commands.keys())
+        return list(self._command_order)
 
     # ignore[override]: expected, we want to use more specific `Context`
     # type than the one declared in superclass.
@@ -103,19 +338,26 @@ class CustomGroup(click.Group):
             cmd_name: str
             ) -> Optional[click.Command]:
         """ Allow command shortening """
-        # Backward-compatible 'test convert' (just temporary for now FIXME)
-        cmd_name = cmd_name.replace('convert', 'import')
-        # Support both story & stories
-        cmd_name = cmd_name.replace('story', 'stories')
+        # Apply aliases to whole command names only, a substring
+        # replace would mangle unrelated names
+        cmd_name = COMMAND_ALIASES.get(cmd_name, cmd_name)
+        factory = self._command_factories.pop(cmd_name, None)
+        if factory is not None:
+            self.add_command(factory(), cmd_name)
         found = click.Group.get_command(self, context, cmd_name)
         if found is not None:
             return found
-        matches = [command for command in self.list_commands(context)
-                   if command.startswith(cmd_name)]
+        if self._prefix_index is None:
+            index: Dict[str, List[str]] = {}
+            for command in self._command_order:
+                for prefix_length in range(1, len(command) + 1):
+                    index.setdefault(command[:prefix_length], []).append(command)
+            self._prefix_index = index
+        matches = self._prefix_index.get(cmd_name, [])
         if not matches:
             return None
         elif len(matches) == 1:
-            return click.Group.get_command(self, context, matches[0])
+            return self.get_command(context, matches[0])
         context.fail('Did you mean {}?'.format(
             listed(sorted(matches), join='or')))
         return None
@@ -186,12 +428,11 @@ def main(
     tmt.utils.Common._save_context(click_contex)
 
     # Initialize metadata tree (from given path or current directory)
-    tree = tmt.Tree(logger=logger, path=Path(root))
+    tree = tmt.Tree(logger=logger, path=_path(root))
 
     # TODO: context object details need checks
     click_contex.obj = ContextObject(
         logger=logger,
-        common=tmt.utils.Common(logger=logger),
         fmf_context=tmt.utils.context_to_dict(context=context, logger=logger),
         steps=set(),
         tree=tree
@@ -199,9 +440,7 @@ def main(
 
     # Show overview of available tests, plans and stories
     if click_contex.invoked_subcommand is None:
-        tmt.Test.overview(tree)
-        tmt.Plan.overview(tree)
-        tmt.Story.overview(tree)
+        tmt.base.overview_all(tree)
 
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -261,7 +500,7 @@ def run(context: Context, id_: Optional[str], **kwargs: Any) -> None:
     logger.apply_verbosity_options(**kwargs)
 
     run = tmt.Run(
-        id_=Path(id_) if id_ is not None else None,
+        id_=_path(id_) if id_ is not None else None,
         tree=context.obj.tree,
         context=context,
         logger=logger
@@ -270,14 +509,18 @@ def run(context: Context, id_: Optional[str], **kwargs: Any) -> None:
 
 
 # Steps options
-run.add_command(tmt.steps.discover.DiscoverPlugin.command())
-run.add_command(tmt.steps.provision.ProvisionPlugin.command())
-run.add_command(tmt.steps.prepare.PreparePlugin.command())
-run.add_command(tmt.steps.execute.ExecutePlugin.command())
-run.add_command(tmt.steps.report.ReportPlugin.command())
-run.add_command(tmt.steps.finish.FinishPlugin.command())
-run.add_command(tmt.steps.Login.command())
-run.add_command(tmt.steps.Reboot.command())
+# Step commands are built on the first use of the 'run' group, other
+# commands do not pay for constructing per-method click commands.
+# cast() needed as the click decorator types the group as plain Group.
+_run_group = cast(CustomGroup, run)
+_run_group.add_command_factory('discover', tmt.steps.discover.DiscoverPlugin.command)
+_run_group.add_command_factory('provision', tmt.steps.provision.ProvisionPlugin.command)
+_run_group.add_command_factory('prepare', tmt.steps.prepare.PreparePlugin.command)
+_run_group.add_command_factory('execute', tmt.steps.execute.ExecutePlugin.command)
+_run_group.add_command_factory('report', tmt.steps.report.ReportPlugin.command)
+_run_group.add_command_factory('finish', tmt.steps.finish.FinishPlugin.command)
+_run_group.add_command_factory('login', tmt.steps.Login.command)
+_run_group.add_command_factory('reboot', tmt.steps.Reboot.command)
 
 
 @run.command(name='plans')
@@ -341,7 +584,7 @@ def run_tests(context: Context, **kwargs: Any) -> None:
 #        all Fedora + EPEL releases have click 8.0 or newer available.
 run_callback = run.result_callback
 if run_callback is None:
-    run_callback = run.resultcallback
+    run_callback = getattr(run, 'resultcallback')
 
 
 # TODO: commands is unknown, needs revisit
@@ -389,8 +632,9 @@ def tests_ls(context: Context, **kwargs: Any) -> None:
     Use '.' to select tests under the current working directory.
     """
     tmt.Test._save_context(context)
-    for test in context.obj.tree.tests():
-        test.ls()
+    with _buffered_output():
+        for test in _filtered_tests(context):
+            test.ls()
 
 
 @tests.command(name='show')
@@ -405,9 +649,10 @@ def tests_show(context: Context, **kwargs: Any) -> None:
     Use '.' to select tests under the current working directory.
     """
     tmt.Test._save_context(context)
-    for test in context.obj.tree.tests():
-        test.show()
-        echo()
+    with _buffered_output():
+        for test in _filtered_tests(context):
+            test.show()
+            echo()
 
 
 @tests.command(name='lint')
@@ -415,23 +660,22 @@ def tests_show(context: Context, **kwargs: Any) -> None:
 @filter_options
 @fmf_source_options
 @fix_options
+@click.option(
+    '-j', '--jobs', type=int, default=1, show_default=True,
+    help='Number of parallel lint workers.')
 @verbosity_options
-def tests_lint(context: Context, **kwargs: Any) -> None:
+def tests_lint(context: Context, jobs: int, **kwargs: Any) -> None:
     """
     Check tests against the L1 metadata specification.
 
     Regular expression can be used to filter tests for linting.
     Use '.' to select tests under the current working directory.
     """
-    # FIXME: Workaround https://github.com/pallets/click/pull/1840 for click 7
-    context.params.update(**kwargs)
+    if not _CLICK_GE_8:
+        # Workaround https://github.com/pallets/click/pull/1840 for click 7
+        context.params.update(**kwargs)
     tmt.Test._save_context(context)
-    exit_code = 0
-    for test in context.obj.tree.tests():
-        if not test.lint():
-            exit_code = 1
-        echo()
-    raise SystemExit(exit_code)
+    raise SystemExit(_lint_objects(_filtered_tests(context), jobs))
 
 
 _test_templates = listed(tmt.templates.TEST, join='or')
@@ -545,6 +789,9 @@ def tests_import(
     nitrate ...... contact, component, tag, environment, relevancy, enabled
     polarion ..... summary, enabled, assignee, id, component, tag, description, link
     """
+    # Import only when needed to speed up the common cases
+    import tmt.convert
+
     tmt.Test._save_context(context)
 
     if manual:
@@ -558,10 +805,14 @@ def tests_import(
     if not paths:
         paths = ['.']
     for _path in paths:
-        path = Path(_path)
-        # Make sure we've got a real directory
-        path = path.resolve()
-        if not path.is_dir():
+        # Make sure we've got a real directory, checking with a single
+        # stat call - resolve() alone walks the symlinks already
+        path = Path(_path).resolve()
+        try:
+            if not stat.S_ISDIR(os.stat(path).st_mode):
+                raise tmt.utils.GeneralError(
+                    "Path '{0}' is not a directory.".format(path))
+        except OSError:
             raise tmt.utils.GeneralError(
                 "Path '{0}' is not a directory.".format(path))
         # Gather old metadata and store them as fmf
@@ -570,20 +821,26 @@ def tests_import(
             purpose, disabled, types, general)
         # Add path to common metadata if there are virtual test cases
         if individual:
-            root = Path(fmf.Tree(str(path)).root)
+            root = _fmf_tree_root(path)
             common['path'] = str(Path('/') / path.relative_to(root))
         # Store common metadata
         common_path = path / 'main.fmf'
         tmt.convert.write(common_path, common)
-        # Store individual data (as virtual tests)
+        # Store individual data (as virtual tests), building the file
+        # names from a single precomputed prefix as there may be many
+        prefix = str(path) + '/'
         for testcase in individual:
-            testcase_path = path / f'{testcase["extra-nitrate"]}.fmf'
-            tmt.convert.write(testcase_path, testcase)
+            tmt.convert.write(prefix + testcase['extra-nitrate'] + '.fmf', testcase)
         # Adjust runtest.sh content and permission if needed
         tmt.convert.adjust_runtest(path / 'runtest.sh')
 
 
-_test_export_formats = list(tmt.Test.get_export_plugin_registry().keys())
+@functools.lru_cache(maxsize=1)
+def _test_export_formats() -> List[str]:
+    """ Export formats are materialized only when the option is used """
+    return list(tmt.Test.get_export_plugin_registry().keys())
+
+
 _test_export_default = 'yaml'
 
 
@@ -593,11 +850,11 @@ _test_export_default = 'yaml'
 @click.option(
     '-h', '--how', metavar='METHOD', default=_test_export_default, show_default=True,
     help='Output format.',
-    type=click.Choice(choices=_test_export_formats))
+    type=tmt.options.LazyChoice(_test_export_formats))
 @click.option(
     '--format', metavar='FORMAT', default=_test_export_default, show_default=True,
     help='Output format. Deprecated, use --how instead.',
-    type=click.Choice(choices=_test_export_formats))
+    type=tmt.options.LazyChoice(_test_export_formats))
 @click.option(
     '--nitrate', is_flag=True,
     help="Export test metadata to Nitrate, deprecated by '--how nitrate'.")
@@ -677,14 +934,14 @@ def tests_export(
 
     if kwargs.get('fmf_id'):
         echo(tmt.base.FmfId.export_collection(
-            collection=[test.fmf_id for test in context.obj.tree.tests()],
+            collection=[test.fmf_id for test in _filtered_tests(context)],
             format=how,
             template=Path(template) if template else None
             ))
 
     else:
         echo(tmt.Test.export_collection(
-            collection=context.obj.tree.tests(),
+            collection=_filtered_tests(context),
             format=how,
             template=Path(template) if template else None
             ))
@@ -703,9 +960,11 @@ def tests_id(context: Context, **kwargs: Any) -> None:
     filter and the value is stored to disk. Existing identifiers
     are kept intact.
     """
+    import tmt.identifier
+
     tmt.Test._save_context(context)
-    for test in context.obj.tree.tests():
-        tmt.identifier.id_command(test.node, "test", dry=kwargs["dry"])
+    tmt.identifier.id_command_batch(
+        (test.node for test in _filtered_tests(context)), "test", dry=kwargs["dry"])
 
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -744,8 +1003,9 @@ def plans_ls(context: Context, **kwargs: Any) -> None:
     Use '.' to select plans under the current working directory.
     """
     tmt.Plan._save_context(context)
-    for plan in context.obj.tree.plans():
-        plan.ls()
+    with _buffered_output():
+        for plan in _filtered_plans(context):
+            plan.ls()
 
 
 @plans.command(name='show')
@@ -761,32 +1021,32 @@ def plans_show(context: Context, **kwargs: Any) -> None:
     Use '.' to select plans under the current working directory.
     """
     tmt.Plan._save_context(context)
-    for plan in context.obj.tree.plans():
-        plan.show()
-        echo()
+    with _buffered_output():
+        for plan in _filtered_plans(context):
+            plan.show()
+            echo()
 
 
 @plans.command(name='lint')
 @click.pass_context
 @filter_options
 @fmf_source_options
+@click.option(
+    '-j', '--jobs', type=int, default=1, show_default=True,
+    help='Number of parallel lint workers.')
 @verbosity_options
-def plans_lint(context: Context, **kwargs: Any) -> None:
+def plans_lint(context: Context, jobs: int, **kwargs: Any) -> None:
     """
     Check plans against the L2 metadata specification.
 
     Regular expression can be used to filter plans by name.
     Use '.' to select plans under the current working directory.
     """
-    # FIXME: Workaround https://github.com/pallets/click/pull/1840 for click 7
-    context.params.update(**kwargs)
+    if not _CLICK_GE_8:
+        # Workaround https://github.com/pallets/click/pull/1840 for click 7
+        context.params.update(**kwargs)
     tmt.Plan._save_context(context)
-    exit_code = 0
-    for plan in context.obj.tree.plans():
-        if not plan.lint():
-            exit_code = 1
-        echo()
-    raise SystemExit(exit_code)
+    raise SystemExit(_lint_objects(_filtered_plans(context), jobs))
 
 
 _plan_templates = listed(tmt.templates.PLAN, join='or')
@@ -831,7 +1091,12 @@ def plans_create(
     tmt.Plan.create(name, template, context.obj.tree.root, force)
 
 
-_plan_export_formats = list(tmt.Plan.get_export_plugin_registry().keys())
+@functools.lru_cache(maxsize=1)
+def _plan_export_formats() -> List[str]:
+    """ Export formats are materialized only when the option is used """
+    return list(tmt.Plan.get_export_plugin_registry().keys())
+
+
 _plan_export_default = 'yaml'
 
 
@@ -841,11 +1106,11 @@ _plan_export_default = 'yaml'
 @click.option(
     '-h', '--how', metavar='METHOD', default=_plan_export_default, show_default=True,
     help='Output format.',
-    type=click.Choice(choices=_plan_export_formats))
+    type=tmt.options.LazyChoice(_plan_export_formats))
 @click.option(
     '--format', metavar='FORMAT', default=_plan_export_default, show_default=True,
     help='Output format. Deprecated, use --how instead.',
-    type=click.Choice(choices=_plan_export_formats))
+    type=tmt.options.LazyChoice(_plan_export_formats))
 @click.option(
     '-d', '--debug', is_flag=True,
     help='Provide as much debugging details as possible.')
@@ -874,7 +1139,7 @@ def plans_export(
         how = format
 
     echo(tmt.Plan.export_collection(
-        collection=context.obj.tree.plans(),
+        collection=_filtered_plans(context),
         format=how,
         template=Path(template) if template else None
         ))
@@ -893,9 +1158,11 @@ def plans_id(context: Context, **kwargs: Any) -> None:
     filter and the value is stored to disk. Existing identifiers
     are kept intact.
     """
+    import tmt.identifier
+
     tmt.Plan._save_context(context)
-    for plan in context.obj.tree.plans():
-        tmt.identifier.id_command(plan.node, "plan", dry=kwargs["dry"])
+    tmt.identifier.id_command_batch(
+        (plan.node for plan in _filtered_plans(context)), "plan", dry=kwargs["dry"])
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 #  Story
@@ -943,10 +1210,11 @@ def stories_ls(
     Use '.' to select stories under the current working directory.
     """
     tmt.Story._save_context(context)
-    for story in context.obj.tree.stories():
-        if story._match(implemented, verified, documented, covered,
-                        unimplemented, unverified, undocumented, uncovered):
-            story.ls()
+    with _buffered_output():
+        for story in context.obj.tree.stories():
+            if story._match(implemented, verified, documented, covered,
+                            unimplemented, unverified, undocumented, uncovered):
+                story.ls()
 
 
 @stories.command(name='show')
@@ -972,11 +1240,12 @@ def stories_show(
     Use '.' to select stories under the current working directory.
     """
     tmt.Story._save_context(context)
-    for story in context.obj.tree.stories():
-        if story._match(implemented, verified, documented, covered,
-                        unimplemented, unverified, undocumented, uncovered):
-            story.show()
-            echo()
+    with _buffered_output():
+        for story in context.obj.tree.stories():
+            if story._match(implemented, verified, documented, covered,
+                            unimplemented, unverified, undocumented, uncovered):
+                story.show()
+                echo()
 
 
 _story_templates = listed(tmt.templates.STORY, join='or')
@@ -1044,6 +1313,12 @@ def stories_coverage(
     total = code_coverage = test_coverage = docs_coverage = 0
     if not any([code, test, docs]):
         code = test = docs = True
+    # Style the header line just once, outside of the story loop
+    header_line = ''.join(
+        style(text.rjust(4) + ' ', fg='blue')
+        for text, chosen in [
+            ('code', code), ('test', test), ('docs', docs), ('story', True)]
+        if chosen)
     for story in context.obj.tree.stories():
         # Check conditions
         if not story._match(
@@ -1052,14 +1327,7 @@ def stories_coverage(
             continue
         # Show header once
         if not header:
-            if code:
-                headfoot('code')
-            if test:
-                headfoot('test')
-            if docs:
-                headfoot('docs')
-            headfoot('story')
-            echo()
+            echo(header_line)
             header = True
         # Show individual stats
         status = story.coverage(code, test, docs)
@@ -1070,17 +1338,24 @@ def stories_coverage(
     # Summary
     if not total:
         return
+    # Single division, the coverage percentages share the divisor
+    percent = 100 / total
     if code:
-        headfoot('{}%'.format(round(100 * code_coverage / total)))
+        headfoot(f'{round(code_coverage * percent)}%')
     if test:
-        headfoot('{}%'.format(round(100 * test_coverage / total)))
+        headfoot(f'{round(test_coverage * percent)}%')
     if docs:
-        headfoot('{}%'.format(round(100 * docs_coverage / total)))
+        headfoot(f'{round(docs_coverage * percent)}%')
     headfoot('from {}'.format(listed(total, 'story')))
     echo()
 
 
-_story_export_formats = list(tmt.Story.get_export_plugin_registry().keys())
+@functools.lru_cache(maxsize=1)
+def _story_export_formats() -> List[str]:
+    """ Export formats are materialized only when the option is used """
+    return list(tmt.Story.get_export_plugin_registry().keys())
+
+
 _story_export_default = 'yaml'
 
 
@@ -1091,11 +1366,11 @@ _story_export_default = 'yaml'
 @click.option(
     '-h', '--how', metavar='METHOD', default=_story_export_default, show_default=True,
     help='Output format.',
-    type=click.Choice(choices=_story_export_formats))
+    type=tmt.options.LazyChoice(_story_export_formats))
 @click.option(
     '--format', metavar='FORMAT', default=_story_export_default, show_default=True,
     help='Output format. Deprecated, use --how instead.',
-    type=click.Choice(choices=_story_export_formats))
+    type=tmt.options.LazyChoice(_story_export_formats))
 @click.option(
     '-d', '--debug', is_flag=True,
     help='Provide as much debugging details as possible.')
@@ -1131,11 +1406,12 @@ def stories_export(
 
         how = format
 
-    stories = [
+    # A generator is enough, the exporters make a single pass
+    stories = (
         story for story in context.obj.tree.stories(whole=True)
         if story._match(implemented, verified, documented, covered, unimplemented, unverified,
                         undocumented, uncovered)
-        ]
+        )
 
     echo(tmt.Story.export_collection(
         collection=stories,
@@ -1155,11 +1431,12 @@ def stories_lint(context: Context, **kwargs: Any) -> None:
     Regular expression can be used to filter stories by name.
     Use '.' to select stories under the current working directory.
     """
-    # FIXME: Workaround https://github.com/pallets/click/pull/1840 for click 7
-    context.params.update(**kwargs)
+    if not _CLICK_GE_8:
+        # Workaround https://github.com/pallets/click/pull/1840 for click 7
+        context.params.update(**kwargs)
     tmt.Story._save_context(context)
     exit_code = 0
-    for story in context.obj.tree.stories():
+    for story in _filtered_stories(context):
         if not story.lint():
             exit_code = 1
         echo()
@@ -1190,11 +1467,14 @@ def stories_id(
     filter and the value is stored to disk. Existing identifiers
     are kept intact.
     """
+    import tmt.identifier
+
     tmt.Story._save_context(context)
-    for story in context.obj.tree.stories():
-        if story._match(implemented, verified, documented, covered,
-                        unimplemented, unverified, undocumented, uncovered):
-            tmt.identifier.id_command(story.node, "story", dry=kwargs["dry"])
+    tmt.identifier.id_command_batch(
+        (story.node for story in context.obj.tree.stories()
+         if story._match(implemented, verified, documented, covered,
+                         unimplemented, unverified, undocumented, uncovered)),
+        "story", dry=kwargs["dry"])
 
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -1276,11 +1556,11 @@ def status(
     displayed with the most verbosity (-vv).
 
     """
-    if [abandoned, active, finished].count(True) > 1:
+    if abandoned + active + finished > 1:
         raise tmt.utils.GeneralError(
             "Options --abandoned, --active and --finished cannot be "
             "used together.")
-    if not Path(workdir_root).exists():
+    if not Path(workdir_root).is_dir():
         raise tmt.utils.GeneralError(f"Path '{workdir_root}' doesn't exist.")
     status_obj = tmt.Status(logger=context.obj.logger, context=context)
     status_obj.show()
@@ -1293,6 +1573,9 @@ def status(
 
 @main.group(chain=True, invoke_without_command=True, cls=CustomGroup)
 @click.pass_context
+@click.option(
+    '--fail-fast', is_flag=True,
+    help='Stop right after the first failed cleanup action.')
 @verbosity_options
 @dry_options
 def clean(context: Context, **kwargs: Any) -> None:
@@ -1329,9 +1612,7 @@ def clean(context: Context, **kwargs: Any) -> None:
         # Create another level to the hierarchy so that logging indent is
         # consistent between the command and subcommands
         clean_obj = tmt.Clean(
-            logger=context.obj.clean_logger
-            .descend(logger_name='clean-images', extra_shift=0)
-            .apply_verbosity_options(**kwargs),
+            logger=context.obj.clean_logger_for('clean-images', **kwargs),
             parent=clean_obj,
             context=context
             )
@@ -1351,7 +1632,7 @@ def clean(context: Context, **kwargs: Any) -> None:
 # FIXME: Click deprecation, see function finito for more info
 clean_callback = clean.result_callback
 if clean_callback is None:
-    clean_callback = clean.resultcallback
+    clean_callback = getattr(clean, 'resultcallback')
 
 
 @clean_callback()
@@ -1368,11 +1649,16 @@ def perform_clean(
     even if the user specified them in reverse order.
     """
     clean_order = ("guests", "runs", "images")
+    fail_fast = click_context.params.get('fail_fast', False)
     exit_code = 0
     for phase in clean_order:
         for partial in click_context.obj.clean_partials[phase]:
             if not partial():
                 exit_code = 1
+                # Skip the remaining actions when failing fast,
+                # stopping guests can take a while
+                if fail_fast:
+                    raise SystemExit(exit_code)
     raise SystemExit(exit_code)
 
 
@@ -1401,21 +1687,16 @@ def clean_runs(
 
     Remove all runs in '/var/tmp/tmt' by default.
     """
-    defined = [last is True, id_ is not None, keep is not None]
-    if defined.count(True) > 1:
+    if (last is True) + (id_ is not None) + (keep is not None) > 1:
         raise tmt.utils.GeneralError(
             "Options --last, --id and --keep cannot be used together.")
     if keep is not None and keep < 0:
         raise tmt.utils.GeneralError("--keep must not be a negative number.")
-    if not Path(workdir_root).exists():
+    if not Path(workdir_root).is_dir():
         raise tmt.utils.GeneralError(f"Path '{workdir_root}' doesn't exist.")
 
-    assert context.obj.clean_logger is not None  # narrow type
-
     clean_obj = tmt.Clean(
-        logger=context.obj.clean_logger
-        .descend(logger_name='clean-runs', extra_shift=0)
-        .apply_verbosity_options(**kwargs),
+        logger=context.obj.clean_logger_for('clean-runs', **kwargs),
         parent=context.obj.clean,
         context=context)
     context.obj.clean_partials["runs"].append(clean_obj.runs)
@@ -1448,15 +1729,11 @@ def clean_guests(
     if last and id_ is not None:
         raise tmt.utils.GeneralError(
             "Options --last and --id cannot be used together.")
-    if not Path(workdir_root).exists():
+    if not Path(workdir_root).is_dir():
         raise tmt.utils.GeneralError(f"Path '{workdir_root}' doesn't exist.")
 
-    assert context.obj.clean_logger is not None  # narrow type
-
     clean_obj = tmt.Clean(
-        logger=context.obj.clean_logger
-        .descend(logger_name='clean-guests', extra_shift=0)
-        .apply_verbosity_options(**kwargs),
+        logger=context.obj.clean_logger_for('clean-guests', **kwargs),
         parent=context.obj.clean,
         context=context
         )
@@ -1477,12 +1754,8 @@ def clean_images(context: Context, **kwargs: Any) -> None:
     # FIXME: If there are more provision methods supporting this,
     #        we should add options to specify which provision should be
     #        cleaned, similarly to guests.
-    assert context.obj.clean_logger is not None  # narrow type
-
     clean_obj = tmt.Clean(
-        logger=context.obj.clean_logger
-        .descend(logger_name='clean-images', extra_shift=0)
-        .apply_verbosity_options(**kwargs),
+        logger=context.obj.clean_logger_for('clean-images', **kwargs),
         parent=context.obj.clean,
         context=context
         )
@@ -1567,12 +1840,14 @@ def setup_completion(shell: str, install: bool) -> None:
     else:
         script = Path(config.path) / f'{COMPLETE_SCRIPT}.{shell}'
 
-    out = open(script, 'w') if install else sys.stdout
-    subprocess.run(f'{COMPLETE_VARIABLE}={shell}_source tmt',
-                   shell=True, stdout=out)
+    # The context manager closes the script file even when the command
+    # fails, standard output is left open
+    with open(script, 'w') if install else contextlib.nullcontext(sys.stdout) as out:
+        subprocess.run(['tmt'],
+                       env={**os.environ, COMPLETE_VARIABLE: f'{shell}_source'},
+                       stdout=out)
 
     if install:
-        out.close()
         # If requested, modify .bashrc or .zshrc
         if shell != 'fish':
             config_path = Path(f'~/.{shell}rc').expanduser()
@@ -3,6 +3,7 @@
 """ Convert metadata into the new format """
 
 import copy
+import functools
 import os
 import pprint
 import re
@@ -1025,15 +1026,22 @@ def adjust_runtest(path: Path) -> None:
             "Could not make '{0}' executable.".format(path))
 
 
-def write(path: Path, data: NitrateDataType) -> None:
-    """ Write gathered metadata in the fmf format """
-    # Put keys into a reasonable order
+# Keys in a reasonable order for stored fmf files, computed just once
+# as write() is called for every single virtual test case
+@functools.lru_cache(maxsize=1)
+def _write_key_order() -> List[str]:
     extra_keys = [
         'adjust', 'extra-nitrate',
         'extra-summary', 'extra-task',
         'extra-hardware', 'extra-pepa']
+    return tmt.base.Test._keys() + extra_keys
+
+
+def write(path: Union[str, Path], data: NitrateDataType) -> None:
+    """ Write gathered metadata in the fmf format """
+    # Put keys into a reasonable order
     sorted_data = dict()
-    for key in tmt.base.Test._keys() + extra_keys:
+    for key in _write_key_order():
         try:
             sorted_data[key] = data[key]
         except KeyError:
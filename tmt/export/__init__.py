@@ -13,7 +13,8 @@ import traceback
 import types
 import xmlrpc.client
 from typing import (TYPE_CHECKING, Any, Callable, ClassVar, Dict, Generic,
-                    List, Optional, Tuple, Type, TypeVar, Union, cast)
+                    Iterable, List, Optional, Tuple, Type, TypeVar, Union,
+                    cast)
 
 if sys.version_info >= (3, 8):
     from typing import Protocol
@@ -60,7 +61,10 @@ _RawExported = Union[_RawExportedInstance, _RawExportedCollection]
 
 # Protocols describing export methods.
 class Exporter(Protocol):
-    def __call__(self, collection: List[ExportableT], keys: Optional[List[str]] = None) -> str:
+    def __call__(
+            self,
+            collection: Iterable[ExportableT],
+            keys: Optional[List[str]] = None) -> str:
         pass
 
 
@@ -152,7 +156,7 @@ class Exportable(Generic[ExportableT], tmt.utils._CommonBase):
     def export_collection(
             cls: Type[ExportableT],
             *,
-            collection: List[ExportableT],
+            collection: Iterable[ExportableT],
             format: str,
             keys: Optional[List[str]] = None,
             **kwargs: Any) -> str:
@@ -172,13 +176,13 @@ class ExportPlugin:
     """ Base class for plugins providing metadata export functionality """
 
     @classmethod
-    def export_fmfid_collection(cls, fmf_ids: List['tmt.base.FmfId'], **kwargs: Any) -> str:
+    def export_fmfid_collection(cls, fmf_ids: Iterable['tmt.base.FmfId'], **kwargs: Any) -> str:
         """ Export collection of fmf ids """
         raise NotImplementedError()
 
     @classmethod
     def export_test_collection(cls,
-                               tests: List['tmt.base.Test'],
+                               tests: Iterable['tmt.base.Test'],
                                keys: Optional[List[str]] = None,
                                **kwargs: Any) -> str:
         """ Export collection of tests """
@@ -186,7 +190,7 @@ class ExportPlugin:
 
     @classmethod
     def export_plan_collection(cls,
-                               plans: List['tmt.base.Plan'],
+                               plans: Iterable['tmt.base.Plan'],
                                keys: Optional[List[str]] = None,
                                **kwargs: Any) -> str:
         """ Export collection of plans """
@@ -194,7 +198,7 @@ class ExportPlugin:
 
     @classmethod
     def export_story_collection(cls,
-                                stories: List['tmt.base.Story'],
+                                stories: Iterable['tmt.base.Story'],
                                 keys: Optional[List[str]] = None,
                                 **kwargs: Any) -> str:
         """ Export collection of stories """
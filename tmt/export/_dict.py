@@ -1,4 +1,4 @@
-from typing import Any, List, Optional
+from typing import Any, Iterable, List, Optional
 
 import tmt.base
 import tmt.export
@@ -16,28 +16,28 @@ class DictExporter(tmt.export.ExportPlugin):
 
     @classmethod
     def export_fmfid_collection(cls,
-                                fmf_ids: List[tmt.base.FmfId],
+                                fmf_ids: Iterable[tmt.base.FmfId],
                                 keys: Optional[List[str]] = None,
                                 **kwargs: Any) -> str:
         return cls._export([fmf_id._export(keys=keys) for fmf_id in fmf_ids])
 
     @classmethod
     def export_test_collection(cls,
-                               tests: List[tmt.base.Test],
+                               tests: Iterable[tmt.base.Test],
                                keys: Optional[List[str]] = None,
                                **kwargs: Any) -> str:
         return cls._export([test._export(keys=keys) for test in tests])
 
     @classmethod
     def export_plan_collection(cls,
-                               plans: List[tmt.base.Plan],
+                               plans: Iterable[tmt.base.Plan],
                                keys: Optional[List[str]] = None,
                                **kwargs: Any) -> str:
         return cls._export([plan._export(keys=keys) for plan in plans])
 
     @classmethod
     def export_story_collection(cls,
-                                stories: List[tmt.base.Story],
+                                stories: Iterable[tmt.base.Story],
                                 keys: Optional[List[str]] = None,
                                 **kwargs: Any) -> str:
         return cls._export([story._export(keys=keys) for story in stories])
@@ -3,8 +3,8 @@ import os
 import re
 import types
 from functools import lru_cache
-from typing import (TYPE_CHECKING, Any, Dict, Generator, List, Optional, Tuple,
-                    Union, cast)
+from typing import (TYPE_CHECKING, Any, Dict, Generator, Iterable, List,
+                    Optional, Tuple, Union, cast)
 
 import fmf.context
 from click import echo, style
@@ -652,7 +652,7 @@ def export_to_nitrate(test: 'tmt.Test') -> None:
 class NitrateExporter(tmt.export.ExportPlugin):
     @classmethod
     def export_test_collection(cls,
-                               tests: List[tmt.base.Test],
+                               tests: Iterable[tmt.base.Test],
                                keys: Optional[List[str]] = None,
                                **kwargs: Any) -> str:
         for test in tests:
@@ -1,7 +1,7 @@
 import email.utils
 import re
 import traceback
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import fmf.utils
 from click import echo, style
@@ -340,7 +340,7 @@ def export_to_polarion(test: tmt.base.Test) -> None:
 class PolarionExporter(tmt.export.ExportPlugin):
     @classmethod
     def export_test_collection(cls,
-                               tests: List[tmt.base.Test],
+                               tests: Iterable[tmt.base.Test],
                                keys: Optional[List[str]] = None,
                                **kwargs: Any) -> str:
         for test in tests:
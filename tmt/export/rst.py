@@ -1,4 +1,4 @@
-from typing import Any, List, Optional
+from typing import Any, Iterable, List, Optional
 
 import tmt.base
 import tmt.export
@@ -21,7 +21,7 @@ class RestructuredExporter(tmt.export.ExportPlugin):
 
     @classmethod
     def export_story_collection(cls,
-                                stories: List[tmt.base.Story],
+                                stories: Iterable[tmt.base.Story],
                                 keys: Optional[List[str]] = None,
                                 include_title: bool = True,
                                 **kwargs: Any) -> str:
@@ -1,4 +1,4 @@
-from typing import Any, List, Optional
+from typing import Any, Iterable, List, Optional
 
 import tmt.base
 import tmt.export
@@ -25,7 +25,7 @@ class TemplateExporter(tmt.export.ExportPlugin):
 
     @classmethod
     def export_fmfid_collection(cls,
-                                fmf_ids: List[tmt.base.FmfId],
+                                fmf_ids: Iterable[tmt.base.FmfId],
                                 keys: Optional[List[str]] = None,
                                 template: Optional[Path] = None,
                                 **kwargs: Any) -> str:
@@ -40,7 +40,7 @@ class TemplateExporter(tmt.export.ExportPlugin):
 
     @classmethod
     def export_test_collection(cls,
-                               tests: List[tmt.base.Test],
+                               tests: Iterable[tmt.base.Test],
                                keys: Optional[List[str]] = None,
                                template: Optional[Path] = None,
                                **kwargs: Any) -> str:
@@ -55,7 +55,7 @@ class TemplateExporter(tmt.export.ExportPlugin):
 
     @classmethod
     def export_plan_collection(cls,
-                               plans: List[tmt.base.Plan],
+                               plans: Iterable[tmt.base.Plan],
                                keys: Optional[List[str]] = None,
                                template: Optional[Path] = None,
                                **kwargs: Any) -> str:
@@ -70,7 +70,7 @@ class TemplateExporter(tmt.export.ExportPlugin):
 
     @classmethod
     def export_story_collection(cls,
-                                stories: List[tmt.base.Story],
+                                stories: Iterable[tmt.base.Story],
                                 keys: Optional[List[str]] = None,
                                 template: Optional[Path] = None,
                                 include_title: bool = True,
@@ -1,4 +1,4 @@
-from typing import Any, List, Optional
+from typing import Any, Iterable, List, Optional
 
 import tmt.base
 import tmt.export
@@ -14,30 +14,48 @@ class YAMLExporter(tmt.export.ExportPlugin):
     def _export(cls, data: tmt.export._RawExported) -> str:
         return tmt.utils.dict_to_yaml(data)
 
+    @classmethod
+    def _export_each(cls,
+                     collection: Iterable[tmt.export.Exportable[Any]],
+                     keys: Optional[List[str]] = None) -> str:
+        """
+        Serialize instances of the collection one by one.
+
+        A top-level yaml sequence can be emitted item by item, and doing
+        so keeps just a single raw dictionary and its yaml node tree
+        alive at a time instead of materializing them for the whole
+        collection before dumping.
+        """
+        exported = ''.join(
+            cls._export([exportable._export(keys=keys)]) for exportable in collection)
+
+        # An empty collection must still produce a valid yaml document
+        return exported or cls._export([])
+
     @classmethod
     def export_fmfid_collection(cls,
-                                fmf_ids: List[tmt.base.FmfId],
+                                fmf_ids: Iterable[tmt.base.FmfId],
                                 keys: Optional[List[str]] = None,
                                 **kwargs: Any) -> str:
-        return cls._export([fmf_id._export(keys=keys) for fmf_id in fmf_ids])
+        return cls._export_each(fmf_ids, keys=keys)
 
     @classmethod
     def export_test_collection(cls,
-                               tests: List[tmt.base.Test],
+                               tests: Iterable[tmt.base.Test],
                                keys: Optional[List[str]] = None,
                                **kwargs: Any) -> str:
-        return cls._export([test._export(keys=keys) for test in tests])
+        return cls._export_each(tests, keys=keys)
 
     @classmethod
     def export_plan_collection(cls,
-                               plans: List[tmt.base.Plan],
+                               plans: Iterable[tmt.base.Plan],
                                keys: Optional[List[str]] = None,
                                **kwargs: Any) -> str:
-        return cls._export([plan._export(keys=keys) for plan in plans])
+        return cls._export_each(plans, keys=keys)
 
     @classmethod
     def export_story_collection(cls,
-                                stories: List[tmt.base.Story],
+                                stories: Iterable[tmt.base.Story],
                                 keys: Optional[List[str]] = None,
                                 **kwargs: Any) -> str:
-        return cls._export([story._export(keys=keys) for story in stories])
+        return cls._export_each(stories, keys=keys)
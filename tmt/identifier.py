@@ -1,7 +1,8 @@
-from typing import Optional, cast
+from typing import Iterable, Optional, cast
 from uuid import uuid4
 
 import fmf
+import fmf.utils
 
 from tmt.utils import log
 
@@ -75,17 +76,43 @@ def add_uuid_if_not_defined(node: fmf.Tree, dry: bool) -> Optional[str]:
     return gen_uuid
 
 
-def id_command(node: fmf.Tree, node_type: str, dry: bool) -> None:
+def id_command_batch(nodes: Iterable[fmf.Tree], node_type: str, dry: bool) -> None:
     """
     Command line interfacing with output to terminal
 
-    Show a brief summary when adding UUIDs to nodes.
+    Show a brief summary when adding UUIDs to nodes. All identifiers
+    are first added in memory and each affected source file is then
+    written just once, as many virtual nodes often share a single fmf
+    file and rewriting it per node gets expensive.
     """
-    generated = add_uuid_if_not_defined(node, dry=dry)
-    if generated:
-        print(
-            f"New id '{generated}' added to {node_type} '{node.name}'.")
-    else:
+    # Source files to store, each exactly once
+    sources = {}
+    for node in nodes:
+        if key_defined_in_leaf(node, key=ID_KEY):
+            log.debug(
+                f"Id '{node.data[ID_KEY]}' already defined for '{node.name}'.")
+            print(
+                f"Existing id '{node.get(ID_KEY)}' "
+                f"found in {node_type} '{node.name}'.")
+            continue
+        gen_uuid = str(uuid4())
+        if not dry:
+            # Modify the raw data in memory only, the file is saved below
+            node_data, full_data, source = node._locate_raw_data()
+            node_data[ID_KEY] = gen_uuid
+            sources[source] = full_data
+            log.debug(f"Generating UUID '{gen_uuid}' for '{node.name}'.")
         print(
-            f"Existing id '{node.get(ID_KEY)}' "
-            f"found in {node_type} '{node.name}'.")
+            f"New id '{gen_uuid}' added to {node_type} '{node.name}'.")
+    for source, full_data in sources.items():
+        with open(source, "w", encoding='utf-8') as file:
+            file.write(fmf.utils.dict_to_yaml(full_data))
+
+
+def id_command(node: fmf.Tree, node_type: str, dry: bool) -> None:
+    """
+    Command line interfacing with output to terminal
+
+    Show a brief summary when adding a UUID to a single node.
+    """
+    id_command_batch([node], node_type, dry)
@@ -26,6 +26,27 @@ if TYPE_CHECKING:
 
 MethodDictType = Dict[str, click.core.Command]
 
+
+class LazyChoice(click.Choice):
+    """
+    Choice parameter type with lazily materialized choices
+
+    Accepts a callable instead of the list of choices, and calls it
+    when the choices are first needed, i.e. when the option is being
+    parsed or its help rendered. Saves the work of building choice
+    lists for commands which are not invoked at all, and picks up
+    choices registered after the command line was declared.
+    """
+
+    def __init__(self, get_choices: Callable[[], List[str]]) -> None:
+        self._get_choices = get_choices
+        self.case_sensitive = True
+
+    # ignore[override]: turning an attribute into a property on purpose
+    @property
+    def choices(self) -> List[str]:  # type: ignore[override]
+        return self._get_choices()
+
 # Originating in click.decorators, an opaque type describing "decorator" functions
 # produced by click.option() calls: not options, but decorators, functions that attach
 # options to a given command.
@@ -168,8 +189,12 @@ REMOTE_PLAN_OPTIONS: List[ClickOptionDecoratorType] = [
 
 
 def create_options_decorator(options: List[ClickOptionDecoratorType]) -> Callable[[FC], FC]:
+    # Freeze the reversed order just once, the returned decorator is
+    # applied to many commands
+    reversed_options = tuple(reversed(options))
+
     def common_decorator(fn: FC) -> FC:
-        for option in reversed(options):
+        for option in reversed_options:
             fn = option(fn)
 
         return fn
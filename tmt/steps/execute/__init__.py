@@ -2,7 +2,7 @@ import dataclasses
 import re
 import time
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Type, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Type, cast
 
 import click
 import fmf
@@ -136,6 +136,10 @@ class ExecutePlugin(tmt.steps.Plugin):
             workdir: tmt.utils.WorkdirArgumentType = None,
             logger: tmt.log.Logger) -> None:
         super().__init__(logger=logger, step=step, data=data, workdir=workdir)
+        # Test data directories, built just once per test and guest
+        self._data_directories: Dict[Tuple[str, str, int], Path] = {}
+        # Directories already checked/created, no need to stat them again
+        self._created_data_directories: Set[Tuple[str, str, int]] = set()
         if tmt.steps.Login._opt('test'):
             self._login_after_test = tmt.steps.Login(logger=logger, step=self.step, order=90)
 
@@ -205,13 +209,18 @@ class ExecutePlugin(tmt.steps.Plugin):
         """
         # Prepare directory path, create if requested
         assert self.step.workdir is not None  # narrow type
-        directory = self.step.workdir \
-            / TEST_DATA \
-            / 'guest' \
-            / guest.name \
-            / f'{test.name.lstrip("/") or "default"}-{test.serialnumber}'
-        if create and not directory.is_dir():
-            directory.joinpath(TEST_DATA).mkdir(parents=True)
+        key = (guest.name, test.name, test.serialnumber)
+        directory = self._data_directories.get(key)
+        if directory is None:
+            directory = self._data_directories[key] = self.step.workdir \
+                / TEST_DATA \
+                / 'guest' \
+                / guest.name \
+                / f'{test.name.lstrip("/") or "default"}-{test.serialnumber}'
+        if create and key not in self._created_data_directories:
+            if not directory.is_dir():
+                directory.joinpath(TEST_DATA).mkdir(parents=True)
+            self._created_data_directories.add(key)
         if not filename:
             return directory
         path = directory / filename
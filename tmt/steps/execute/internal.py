@@ -3,7 +3,7 @@ import json
 import os
 import sys
 import time
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 import click
 
@@ -20,29 +20,37 @@ from tmt.steps.execute import (SCRIPTS, TEST_OUTPUT_FILENAME,
 from tmt.steps.provision import Guest
 from tmt.utils import EnvironmentType, Path, ShellScript
 
-TEST_WRAPPER_FILENAME = 'tmt-test-wrapper.sh'
+TEST_WRAPPER_FILENAME_TEMPLATE = 'tmt-test-wrapper-{}.sh'
 
 TEST_WRAPPER_INTERACTIVE = '{remote_command}'
 TEST_WRAPPER_NONINTERACTIVE = 'set -eo pipefail; {remote_command} </dev/null |& cat'
 
+# Static bits of the per-test work, prepared once at import time
+_REBOOT_VARIABLES = tuple(TMT_REBOOT_SCRIPT.related_variables)
+_SHELL_COMMAND_PREFIX = f'{tmt.utils.SHELL_OPTIONS}; '
+
 
 @dataclasses.dataclass
 class ExecuteInternalData(tmt.steps.execute.ExecuteStepData):
     script: List[ShellScript] = dataclasses.field(default_factory=list)
     interactive: bool = False
 
+    def _script_strings(self) -> List[str]:
+        """ Scripts stringified for spec and serialized forms """
+        return [str(script) for script in self.script]
+
     # ignore[override] & cast: two base classes define to_spec(), with conflicting
     # formal types.
     def to_spec(self) -> Dict[str, Any]:  # type: ignore[override]
         data = cast(Dict[str, Any], super().to_spec())
-        data['script'] = [str(script) for script in self.script]
+        data['script'] = self._script_strings()
 
         return data
 
     def to_serialized(self) -> Dict[str, Any]:
         data = super().to_serialized()
 
-        data['script'] = [str(script) for script in self.script]
+        data['script'] = self._script_strings()
 
         return data
 
@@ -69,10 +77,37 @@ class ExecuteInternal(tmt.steps.execute.ExecutePlugin):
 
     _data_class = ExecuteInternalData
 
+    # Do not redraw the progress bar more often than every 100 ms, fast
+    # tests would otherwise spend time writing frames nobody can read
+    _progress_min_interval = 0.1
+
     def __init__(self, **kwargs: Any):
         super().__init__(**kwargs)
-        self._previous_progress_message = ""
+        # Only the length matters for the padding of the next message
+        self._previous_progress_length = 0
+        self._last_progress_time = 0.0
         self.scripts = SCRIPTS
+        # Reboot request paths, derived just once per test and guest
+        self._reboot_request_paths: Dict[Tuple[str, str], Path] = {}
+        # Options resolved just once per run, see _cache_options()
+        self._opt_verbose = 0
+        self._opt_debug = 0
+        self._opt_no_progress_bar = False
+        self._opt_interactive = False
+        self._stdout_isatty = False
+
+    def _cache_options(self) -> None:
+        """
+        Look up options which cannot change during the run.
+
+        Resolving an option walks the parent chain and checks the
+        environment, no need to repeat that for every executed test.
+        """
+        self._opt_verbose = self.opt('verbose')
+        self._opt_debug = self.opt('debug')
+        self._opt_no_progress_bar = self.opt('no-progress-bar')
+        self._opt_interactive = self.get('interactive')
+        self._stdout_isatty = sys.stdout.isatty()
 
     @classmethod
     def options(cls, how: Optional[str] = None) -> List[tmt.options.ClickOptionDecoratorType]:
@@ -104,31 +139,39 @@ class ExecuteInternal(tmt.steps.execute.ExecutePlugin):
         """
         # Verbose mode outputs other information, using \r to
         # create a status bar wouldn't work.
-        if self.opt('verbose'):
+        if self._opt_verbose:
             return
 
         # No progress if terminal not attached or explicitly disabled
-        if not sys.stdout.isatty() or self.opt('no-progress-bar'):
+        if not self._stdout_isatty or self._opt_no_progress_bar:
             return
 
         # For debug mode show just an info message (unless finishing)
         message = f"{test_name} [{progress}]" if not finish else ""
-        if self.opt('debug'):
+        if self._opt_debug:
             if not finish:
                 self.info(message, shift=1)
             return
 
+        # Throttle the redraw, only the finishing update may not be dropped
+        now = time.monotonic()
+        if not finish and now - self._last_progress_time < self._progress_min_interval:
+            return
+        self._last_progress_time = now
+
         # Show progress bar in an interactive shell.
         # We need to completely override the previous message, add
         # spaces if necessary.
-        message = message.ljust(len(self._previous_progress_message))
-        self._previous_progress_message = message
+        message = message.ljust(self._previous_progress_length)
+        self._previous_progress_length = len(message)
         message = self._indent('progress', message, color='cyan')
-        sys.stdout.write(f"\r{message}")
+        # Emit the whole frame with a single write
+        frame = f"\r{message}"
         if finish:
             # The progress has been overwritten, return back to the start
-            sys.stdout.write("\r")
-            self._previous_progress_message = ""
+            frame += "\r"
+            self._previous_progress_length = 0
+        sys.stdout.write(frame)
         sys.stdout.flush()
 
     def _test_environment(
@@ -141,21 +184,27 @@ class ExecuteInternal(tmt.steps.execute.ExecutePlugin):
         extra_environment = extra_environment or {}
 
         data_directory = self.data_path(test, guest, full=True, create=True)
+        test_data = data_directory / tmt.steps.execute.TEST_DATA
+        reboot_count = str(test._reboot_count)
 
-        environment = extra_environment.copy()
-        environment.update(test.environment)
         assert self.parent is not None
         assert isinstance(self.parent, tmt.steps.execute.Execute)
 
-        environment["TMT_TEST_NAME"] = test.name
-        environment["TMT_TEST_DATA"] = str(data_directory / tmt.steps.execute.TEST_DATA)
-        environment["TMT_TEST_METADATA"] = str(
-            data_directory / tmt.steps.execute.TEST_METADATA_FILENAME)
-        environment["TMT_REBOOT_REQUEST"] = str(
-            data_directory / tmt.steps.execute.TEST_DATA / TMT_REBOOT_SCRIPT.created_file)
-        # Set all supported reboot variables
-        for reboot_variable in TMT_REBOOT_SCRIPT.related_variables:
-            environment[reboot_variable] = str(test._reboot_count)
+        # Build the environment with a single merge instead of growing
+        # the dictionary key by key
+        environment: EnvironmentType = {
+            **extra_environment,
+            **test.environment,
+            "TMT_TEST_NAME": test.name,
+            "TMT_TEST_DATA": str(test_data),
+            "TMT_TEST_METADATA": str(
+                data_directory / tmt.steps.execute.TEST_METADATA_FILENAME),
+            "TMT_REBOOT_REQUEST": str(test_data / TMT_REBOOT_SCRIPT.created_file),
+            # Set all supported reboot variables
+            **{
+                reboot_variable: reboot_count
+                for reboot_variable in _REBOOT_VARIABLES},
+            }
         # Variables related to beakerlib tests
         if test.framework == 'beakerlib':
             environment['BEAKERLIB_DIR'] = str(data_directory)
@@ -174,57 +223,71 @@ class ExecuteInternal(tmt.steps.execute.ExecutePlugin):
         """ Custom logger for test output with shift 2 and level 3 defaults """
         self.verbose(key=key, value=value, color=color, shift=shift, level=level)
 
+    def _test_workdir(self, test: Test) -> Path:
+        """ Test workdir, relative to the discover workdir """
+        assert self.discover.workdir is not None  # narrow type
+        assert test.path is not None  # narrow type
+        return self.discover.workdir / test.path.unrooted()
+
+    @staticmethod
+    def _test_wrapper_filename(test: Test) -> str:
+        """
+        Test wrapper file name
+
+        Tests sharing the same directory must not share the wrapper,
+        make the file name unique using the test serial number.
+        """
+        return TEST_WRAPPER_FILENAME_TEMPLATE.format(test.serialnumber)
+
+    @staticmethod
+    def _test_command(test: Test) -> ShellScript:
+        """ Prepare the test command (use default options for shell tests) """
+        if test.framework == "shell":
+            return ShellScript(_SHELL_COMMAND_PREFIX + str(test.test))
+        return test.test
+
+    def _prepare_wrapper(self, test: Test) -> None:
+        """
+        Write the test wrapper into the test workdir.
+
+        Wrappers are written for all tests before the workdir is pushed
+        to the guest, so a single push carries them all and no per-test
+        push is needed.
+        """
+        test_wrapper_filepath = self._test_workdir(test) / self._test_wrapper_filename(test)
+        self.write(test_wrapper_filepath, str(self._test_command(test)), 'w')
+        test_wrapper_filepath.chmod(0o755)
+
     def execute(self, test: Test, guest: Guest,
                 extra_environment: Optional[EnvironmentType] = None) -> None:
         """ Run test on the guest """
         self.debug(f"Execute '{test.name}' as a '{test.framework}' test.")
 
         # Test will be executed in it's own directory, relative to the workdir
-        assert self.discover.workdir is not None  # narrow type
-        assert test.path is not None  # narrow type
-        workdir = self.discover.workdir / test.path.unrooted()
+        workdir = self._test_workdir(test)
         self.debug(f"Use workdir '{workdir}'.", level=3)
 
         # Create data directory, prepare test environment
         environment = self._test_environment(test, guest, extra_environment)
 
-        test_wrapper_filepath = workdir / TEST_WRAPPER_FILENAME
+        self.debug('Test script', str(self._test_command(test)), level=3)
 
-        # Prepare the test command (use default options for shell tests)
-        if test.framework == "shell":
-            test_command = ShellScript(f"{tmt.utils.SHELL_OPTIONS}; {test.test}")
-        else:
-            test_command = test.test
-        self.debug('Test script', str(test_command), level=3)
-
-        # Prepare the wrapper, push to guest
-        self.write(test_wrapper_filepath, str(test_command), 'w')
-        test_wrapper_filepath.chmod(0o755)
-        guest.push(
-            source=test_wrapper_filepath,
-            destination=test_wrapper_filepath,
-            options=["-s", "-p", "--chmod=755"])
-
-        # Prepare the actual remote command
-        remote_command = ShellScript(f'./{TEST_WRAPPER_FILENAME}')
-        if self.get('interactive'):
-            remote_command = ShellScript(
-                TEST_WRAPPER_INTERACTIVE.format(
-                    remote_command=remote_command))
-        else:
-            remote_command = ShellScript(
-                TEST_WRAPPER_NONINTERACTIVE.format(
-                    remote_command=remote_command))
+        # Prepare the actual remote command, the wrapper itself has been
+        # written and pushed together with the whole workdir already
+        wrapper_template = TEST_WRAPPER_INTERACTIVE \
+            if self._opt_interactive else TEST_WRAPPER_NONINTERACTIVE
+        remote_command = ShellScript(wrapper_template.format(
+            remote_command=f'./{self._test_wrapper_filename(test)}'))
 
         # Execute the test, save the output and return code
-        start = time.time()
+        start = time.monotonic()
         try:
             stdout, _ = guest.execute(
                 remote_command,
                 cwd=workdir,
                 env=environment,
                 join=True,
-                interactive=self.get('interactive'),
+                interactive=self._opt_interactive,
                 log=self._test_output_logger,
                 timeout=tmt.utils.duration_to_seconds(test.duration),
                 test_session=True,
@@ -235,7 +298,7 @@ class ExecuteInternal(tmt.steps.execute.ExecutePlugin):
             test.returncode = error.returncode
             if test.returncode == tmt.utils.PROCESS_TIMEOUT:
                 self.debug(f"Test duration '{test.duration}' exceeded.")
-        end = time.time()
+        end = time.monotonic()
         self.write(
             self.data_path(test, guest, TEST_OUTPUT_FILENAME, full=True),
             stdout or '', mode='a', level=3)
@@ -260,11 +323,17 @@ class ExecuteInternal(tmt.steps.execute.ExecutePlugin):
 
     def _reboot_request_path(self, test: Test, guest: Guest) -> Path:
         """ Return reboot_request """
-        return self.data_path(test, guest, full=True) \
-            / tmt.steps.execute.TEST_DATA \
-            / TMT_REBOOT_SCRIPT.created_file
-
-    def _handle_reboot(self, test: Test, guest: Guest) -> bool:
+        key = (guest.name, test.name)
+        path = self._reboot_request_paths.get(key)
+        if path is None:
+            path = self._reboot_request_paths[key] = \
+                self.data_path(test, guest, full=True) \
+                / tmt.steps.execute.TEST_DATA \
+                / TMT_REBOOT_SCRIPT.created_file
+        return path
+
+    def _handle_reboot(self, test: Test, guest: Guest,
+                       will_reboot: Optional[bool] = None) -> bool:
         """
         Reboot the guest if the test requested it.
 
@@ -272,15 +341,21 @@ class ExecuteInternal(tmt.steps.execute.ExecutePlugin):
         and orchestrate the reboot if it was requested. Also increment
         REBOOTCOUNT variable, reset it to 0 if no reboot was requested
         (going forward to the next test). Return whether reboot was done.
+
+        The caller may pass an already performed reboot request check
+        through ``will_reboot`` to save the repeated stat of the request
+        file.
         """
-        if self._will_reboot(test, guest):
+        if will_reboot is None:
+            will_reboot = self._will_reboot(test, guest)
+        if will_reboot:
             test._reboot_count += 1
             self.debug(f"Reboot during test '{test}' "
                        f"with reboot count {test._reboot_count}.")
             reboot_request_path = self._reboot_request_path(test, guest)
             test_data = self.data_path(test, guest, full=True) / tmt.steps.execute.TEST_DATA
-            with open(reboot_request_path, 'r') as reboot_file:
-                reboot_data = json.loads(reboot_file.read())
+            with open(reboot_request_path, 'rb') as reboot_file:
+                reboot_data = json.load(reboot_file)
             reboot_command = None
             if reboot_data.get('command'):
                 try:
@@ -320,6 +395,7 @@ class ExecuteInternal(tmt.steps.execute.ExecutePlugin):
             logger: tmt.log.Logger) -> None:
         """ Execute available tests """
         super().go(guest=guest, environment=environment, logger=logger)
+        self._cache_options()
         self._results: List[Result] = []
 
         # Nothing to do in dry mode
@@ -335,6 +411,10 @@ class ExecuteInternal(tmt.steps.execute.ExecutePlugin):
             extra_environment: Optional[EnvironmentType] = None) -> None:
         """ Execute tests on provided guest """
 
+        # Resolve the cached options also when called directly, without
+        # going through go(), as the upgrade plugin does
+        self._cache_options()
+
         # Prepare tests and helper scripts, check options
         tests = self.prepare_tests(guest)
         exit_first = self.get('exit-first', default=False)
@@ -343,14 +423,20 @@ class ExecuteInternal(tmt.steps.execute.ExecutePlugin):
         if not guest.localhost:
             self.prepare_scripts(guest)
 
+        # Write all test wrappers so that the workdir push below
+        # carries them to the guest in one go
+        for test in tests:
+            self._prepare_wrapper(test)
+
         # Push workdir to guest and execute tests
         guest.push()
         # We cannot use enumerate here due to continue in the code
         index = 0
-        while index < len(tests):
+        total = len(tests)
+        while index < total:
             test = tests[index]
 
-            progress = f"{index + 1}/{len(tests)}"
+            progress = f"{index + 1}/{total}"
             self._show_progress(progress, test.name)
             self.verbose(
                 'test', test.summary or test.name, color='cyan', shift=1, level=2)
@@ -358,28 +444,31 @@ class ExecuteInternal(tmt.steps.execute.ExecutePlugin):
             self.execute(test, guest, extra_environment=extra_environment)
 
             # Pull test logs from the guest, exclude beakerlib backups
+            data_directory = self.data_path(test, guest, full=True)
             if test.framework == "beakerlib":
-                exclude = [
-                    "--exclude",
-                    str(self.data_path(test, guest, "backup*", full=True))]
+                exclude = ["--exclude", str(data_directory / "backup*")]
             else:
                 exclude = None
-            guest.pull(
-                source=self.data_path(test, guest, full=True),
-                extend_options=exclude)
+            guest.pull(source=data_directory, extend_options=exclude)
 
             results = self.check(test, guest)  # Produce list of results
             assert test.real_duration is not None  # narrow type
-            duration = click.style(test.real_duration, fg='cyan')
-            shift = 1 if self.opt('verbose') < 2 else 2
+            # Style the durations only when the verbose messages
+            # consuming them are actually shown
+            styling = bool(self._opt_verbose)
+            duration = click.style(
+                test.real_duration, fg='cyan') if styling else test.real_duration
+            shift = 1 if self._opt_verbose < 2 else 2
 
             # Handle reboot, abort, exit-first
+            # Check the reboot request file just once for both the
+            # condition and the actual handling
             if self._will_reboot(test, guest):
                 # Output before the reboot
                 self.verbose(
                     f"{duration} {test.name} [{progress}]", shift=shift)
                 try:
-                    if self._handle_reboot(test, guest):
+                    if self._handle_reboot(test, guest, will_reboot=True):
                         continue
                 except tmt.utils.RebootTimeoutError:
                     for result in results:
@@ -393,7 +482,11 @@ class ExecuteInternal(tmt.steps.execute.ExecutePlugin):
             self._results.extend(results)
             for result in results:
                 # If test duration information is missing, print 8 spaces to keep indention
-                duration = click.style(result.duration, fg='cyan') if result.duration else 8 * ' '
+                if result.duration:
+                    duration = click.style(
+                        result.duration, fg='cyan') if styling else result.duration
+                else:
+                    duration = 8 * ' '
                 self.verbose(f"{duration} {result.show()} [{progress}]", shift=shift)
             if (abort or exit_first and
                     result.result not in (ResultOutcome.PASS, ResultOutcome.INFO)):
@@ -1,17 +1,18 @@
+import base64
 import collections
 import dataclasses
 import datetime
 import enum
 import os
-import random
 import re
 import shlex
-import string
+import socket
 import subprocess
 import tempfile
+import time
 from shlex import quote
-from typing import (TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type,
-                    Union, cast, overload)
+from typing import (TYPE_CHECKING, Any, Dict, List, Optional, Pattern, Tuple,
+                    Type, Union, cast, overload)
 
 import click
 import fmf
@@ -37,12 +38,65 @@ CONNECTION_TIMEOUT = 5 * 60
 RECONNECT_WAIT_TICK = 5
 RECONNECT_WAIT_TICK_INCREASE = 1.0
 
+# When polling for a guest to come back after reboot, failed connection
+# attempts back off by this factor, up to this many seconds.
+REBOOT_BACKOFF_FACTOR = 2.0
+REBOOT_BACKOFF_CAP = 30
+
 # Default rsync options
 DEFAULT_RSYNC_OPTIONS = [
     "-s", "-R", "-r", "-z", "--links", "--safe-links", "--delete"]
 
 DEFAULT_RSYNC_PUSH_OPTIONS = ["-s", "-R", "-r", "-z", "--links", "--safe-links", "--delete"]
-DEFAULT_RSYNC_PULL_OPTIONS = ["-s", "-R", "-r", "-z", "--links", "--safe-links", "--protect-args"]
+# Pulled files are mostly fresh test artifacts, skip the delta
+# algorithm ('-W') so both ends read each changed file just once
+DEFAULT_RSYNC_PULL_OPTIONS = [
+    "-s", "-R", "-r", "-z", "-W", "--links", "--safe-links", "--protect-args"]
+
+# Single command fetching all guest details at once to save ssh round
+# trips, individual parts are separated by the marker lines
+_DETAILS_SCRIPT = ShellScript(
+    'for file in /etc/os-release /etc/lsb-release /etc/redhat-release; do '
+    '[ -r "$file" ] && { echo "==$file=="; cat "$file"; }; '
+    'done; echo "==uname=="; uname -r')
+
+_DETAILS_SECTION_PATTERN = re.compile(r'^==(\S+)==$', re.M)
+
+# Pattern extracting the guest boot time from /proc/stat
+_BOOT_TIME_PATTERN = re.compile(r'btime\s+(\d+)')
+
+# Patterns for extracting the distro name, tried in the listed order
+_DISTRO_DETAIL_PATTERNS: List[Tuple[str, Pattern[str]]] = [
+    # Check os-release first
+    ('/etc/os-release', re.compile(r'PRETTY_NAME="(.*)"')),
+    # Check for lsb-release
+    ('/etc/lsb-release', re.compile(r'DISTRIB_DESCRIPTION="(.*)"')),
+    # Check for redhat-release
+    ('/etc/redhat-release', re.compile(r'(.+)'))
+    ]
+
+# Ansible result summary numbers, all gathered from the recap lines in
+# a single pass over the output
+_ANSIBLE_SUMMARY_KEYS = 'ok changed unreachable failed skipped rescued ignored'.split()
+_ANSIBLE_RECAP_LINE_PATTERN = re.compile(r'^.*\s:\s.*$', re.M)
+_ANSIBLE_SUMMARY_PATTERN = re.compile(
+    rf'\b({"|".join(_ANSIBLE_SUMMARY_KEYS)})=(\d+)')
+
+
+# Directory for the ssh master connection sockets, detected just once
+_SSH_MASTER_SOCKET_DIR: Optional[Path] = None
+
+
+def _ssh_master_socket_dir() -> Path:
+    """ Prepare directory for the master connection sockets """
+    global _SSH_MASTER_SOCKET_DIR
+    if _SSH_MASTER_SOCKET_DIR is None:
+        # Use '/run/user/uid' if it exists, '/tmp' otherwise
+        run_dir = Path(f"/run/user/{os.getuid()}")
+        socket_dir = run_dir / "tmt" if run_dir.is_dir() else Path("/tmp")
+        socket_dir.mkdir(exist_ok=True)
+        _SSH_MASTER_SOCKET_DIR = socket_dir
+    return _SSH_MASTER_SOCKET_DIR
 
 
 class CheckRsyncOutcome(enum.Enum):
@@ -107,14 +161,24 @@ class Guest(tmt.utils.Common):
         """ Initialize guest data """
         super().__init__(logger=logger, parent=parent, name=name)
 
+        # Options do not change during the run, snapshot the frequently
+        # used ones instead of walking the parent chain on every command
+        self._dry = bool(self.opt('dry'))
+        self._debug_level = int(self.opt('debug') or 0)
+
+        # Metadata tree root, resolved lazily, constant per guest
+        self._tree_root: Optional[Path] = None
+
         self.load(data)
 
     def _random_name(self, prefix: str = '', length: int = 16) -> str:
         """ Generate a random name """
         # Append at least 5 random characters
         min_random_part = max(5, length - len(prefix))
-        name = prefix + ''.join(
-            random.choices(string.ascii_letters, k=min_random_part))
+        # Base32 turns every 5 bytes of entropy into 8 characters
+        raw = os.urandom((min_random_part + 7) // 8 * 5)
+        name = prefix + base64.b32encode(raw).decode(
+            'ascii').rstrip('=').lower()[:min_random_part]
         # Return tail (containing random characters) of name
         return name[-length:]
 
@@ -197,72 +261,52 @@ class Guest(tmt.utils.Common):
     def details(self) -> None:
         """ Show guest details such as distro and kernel """
         # Skip distro & kernel check in dry mode
-        if self.opt('dry'):
+        if self._dry:
             return
 
         self.info('full name', self.full_name, 'green')
 
-        # A small helper to make the repeated run & extract combo easier on eyes.
-        def _fetch_detail(command: Command, pattern: str) -> str:
-            output = self.execute(command, silent=True)
-
-            if not output.stdout:
-                raise tmt.utils.RunError(
-                    'command produced no usable output',
-                    command,
-                    0,
-                    output.stdout,
-                    output.stderr)
-
-            match = re.search(pattern, output.stdout)
+        # Fetch all release files and the kernel version in one command
+        # instead of paying a full round-trip for each of them
+        output = self.execute(_DETAILS_SCRIPT, silent=True)
+        stdout = output.stdout or ''
 
-            if not match:
-                raise tmt.utils.RunError(
-                    'command produced no usable output',
-                    command,
-                    0,
-                    output.stdout,
-                    output.stderr)
+        # Handle standard cloud images message when connecting
+        if 'Please login as the user' in stdout:
+            raise tmt.utils.GeneralError(
+                f'Login to the guest failed.\n{stdout}')
 
-            return match.group(1)
+        # Split the output into sections by the marker lines
+        sections: Dict[str, str] = {}
+        markers = list(_DETAILS_SECTION_PATTERN.finditer(stdout))
+        for index, marker in enumerate(markers):
+            end = markers[index + 1].start() if index + 1 < len(markers) else len(stdout)
+            sections[marker.group(1)] = stdout[marker.end():end].strip()
 
         # Distro
-        distro_commands: List[Tuple[Command, str]] = [
-            # Check os-release first
-            (Command('cat', '/etc/os-release'), r'PRETTY_NAME="(.*)"'),
-            # Check for lsb-release
-            (Command('cat', '/etc/lsb-release'), r'DISTRIB_DESCRIPTION="(.*)"'),
-            # Check for redhat-release
-            (Command('cat', '/etc/redhat-release'), r'(.*)')
-            ]
-
-        for command, pattern in distro_commands:
-            try:
-                distro: Optional[str] = _fetch_detail(command, pattern)
+        for filename, pattern in _DISTRO_DETAIL_PATTERNS:
+            match = pattern.search(sections.get(filename, ''))
+            if match:
+                self.info('distro', match.group(1), 'green')
                 break
-            except tmt.utils.RunError:
-                continue
-        else:
-            distro = None
-
-        # Handle standard cloud images message when connecting
-        if distro is not None and 'Please login as the user' in distro:
-            raise tmt.utils.GeneralError(
-                f'Login to the guest failed.\n{distro}')
-
-        if distro:
-            self.info('distro', distro, 'green')
 
         # Kernel
-        kernel = _fetch_detail(Command('uname', '-r'), r'(.+)')
+        kernel = sections.get('uname')
+        if not kernel:
+            raise tmt.utils.RunError(
+                'command produced no usable output',
+                _DETAILS_SCRIPT.to_shell_command(),
+                0,
+                output.stdout,
+                output.stderr)
         self.verbose('kernel', kernel, 'green')
 
     def _ansible_verbosity(self) -> List[str]:
         """ Prepare verbose level based on the --debug option count """
-        if self.opt('debug') < 3:
+        if self._debug_level < 3:
             return []
         else:
-            return ['-' + (self.opt('debug') - 2) * 'v']
+            return ['-' + (self._debug_level - 2) * 'v']
 
     @staticmethod
     def _ansible_extra_args(extra_args: Optional[str]) -> List[str]:
@@ -276,23 +320,29 @@ class Guest(tmt.utils.Common):
         """ Check the output for ansible result summary numbers """
         if not output:
             return
-        keys = 'ok changed unreachable failed skipped rescued ignored'.split()
-        for key in keys:
-            matched = re.search(rf'^.*\s:\s.*{key}=(\d+).*$', output, re.M)
-            if matched and int(matched.group(1)) > 0:
-                tasks = fmf.utils.listed(matched.group(1), 'task')
+        # Pick the first count reported for each key
+        counts: Dict[str, str] = {}
+        for line in _ANSIBLE_RECAP_LINE_PATTERN.finditer(output):
+            for matched in _ANSIBLE_SUMMARY_PATTERN.finditer(line.group()):
+                counts.setdefault(matched.group(1), matched.group(2))
+        for key in _ANSIBLE_SUMMARY_KEYS:
+            count = counts.get(key)
+            if count and int(count) > 0:
+                tasks = fmf.utils.listed(count, 'task')
                 self.verbose(key, tasks, 'green')
 
     def _ansible_playbook_path(self, playbook: Path) -> Path:
         """ Prepare full ansible playbook path """
         self.debug(f"Applying playbook '{playbook}' on guest '{self.guest}'.")
-        # FIXME: cast() - https://github.com/teemtee/tmt/issues/1372
-        parent = cast(Provision, self.parent)
-        assert parent.plan.my_run is not None  # narrow type
-        assert parent.plan.my_run.tree is not None  # narrow type
-        assert parent.plan.my_run.tree.root is not None  # narrow type
+        if self._tree_root is None:
+            # FIXME: cast() - https://github.com/teemtee/tmt/issues/1372
+            parent = cast(Provision, self.parent)
+            assert parent.plan.my_run is not None  # narrow type
+            assert parent.plan.my_run.tree is not None  # narrow type
+            assert parent.plan.my_run.tree.root is not None  # narrow type
+            self._tree_root = parent.plan.my_run.tree.root
         # Playbook paths should be relative to the metadata tree root
-        playbook = parent.plan.my_run.tree.root / playbook.unrooted()
+        playbook = self._tree_root / playbook.unrooted()
         self.debug(f"Playbook full path: '{playbook}'", level=2)
         return playbook
 
@@ -317,9 +367,10 @@ class Guest(tmt.utils.Common):
         """ Prepare shell export of environment variables """
         if not environment:
             return []
+        # A single export statement keeps the remote command short and
+        # leaves just one statement for the remote shell to parse
         return [
-            ShellScript(f'export {variable}')
-            for variable in tmt.utils.shell_variables(environment)
+            ShellScript(f'export {" ".join(tmt.utils.shell_variables(environment))}')
             ]
 
     def ansible(self, playbook: Path, extra_args: Optional[str] = None) -> None:
@@ -483,32 +534,30 @@ class Guest(tmt.utils.Common):
         Returns 'already installed' when rsync is already present.
         """
 
-        # Check for rsync (nothing to do if already installed)
+        # Check for rsync, the package manager and a read-only distro
+        # with a single command, each probe would cost a round trip
         self.debug("Ensure that rsync is installed on the guest.")
-        try:
-            self.execute(Command('rsync', '--version'))
+        output = self.execute(ShellScript(
+            'for tool in rsync dnf rpm-ostree; do '
+            'command -v "$tool" >/dev/null 2>&1 && echo "$tool"; '
+            'done; true'))
+        tools = (output.stdout or '').split()
+
+        # Nothing to do if already installed
+        if 'rsync' in tools:
             return CheckRsyncOutcome.ALREADY_INSTALLED
-        except tmt.utils.RunError:
-            pass
 
         # Check the package manager
-        self.debug("Check the package manager.")
-        try:
-            self.execute(Command('dnf', '--version'))
-            package_manager = "dnf"
-        except tmt.utils.RunError:
-            package_manager = "yum"
+        package_manager = "dnf" if 'dnf' in tools else "yum"
 
         # Install under '/root/pkg' for read-only distros
         # (for now the check is based on 'rpm-ostree' presence)
         # FIXME: Find a better way how to detect read-only distros
-        self.debug("Check for a read-only distro.")
-        try:
-            self.execute(Command('rpm-ostree', '--version'))
+        if 'rpm-ostree' in tools:
             readonly = (
                 " --installroot=/root/pkg --releasever / "
                 "&& ln -sf /root/pkg/bin/rsync /usr/local/bin/rsync")
-        except tmt.utils.RunError:
+        else:
             readonly = ""
 
         # Install the rsync
@@ -572,6 +621,10 @@ class GuestSsh(Guest):
     # Master ssh connection process and socket path
     _ssh_master_process: Optional['subprocess.Popen[bytes]'] = None
     _ssh_socket_path: Optional[Path] = None
+    # Options do not change while the connection settings stay the same,
+    # build them just once per settings (some plugins assign the port
+    # only after the guest has booted)
+    _cached_ssh_options: Optional[Tuple[Tuple[Any, ...], Command]] = None
 
     def _ssh_guest(self) -> str:
         """ Return user@guest """
@@ -580,18 +633,25 @@ class GuestSsh(Guest):
     def _ssh_socket(self) -> Path:
         """ Prepare path to the master connection socket """
         if not self._ssh_socket_path:
-            # Use '/run/user/uid' if it exists, '/tmp' otherwise
-            run_dir = Path(f"/run/user/{os.getuid()}")
-            if run_dir.is_dir():
-                socket_dir = run_dir / "tmt"
-            else:
-                socket_dir = Path("/tmp")
-            socket_dir.mkdir(exist_ok=True)
-            self._ssh_socket_path = Path(tempfile.mktemp(dir=socket_dir))
+            # Create and remove a temporary file just to safely pick a
+            # unique name, the socket itself is created by ssh later
+            handle, socket_path = tempfile.mkstemp(
+                prefix="tmt-ssh-", dir=_ssh_master_socket_dir())
+            os.close(handle)
+            os.unlink(socket_path)
+            self._ssh_socket_path = Path(socket_path)
         return self._ssh_socket_path
 
     def _ssh_options(self) -> Command:
         """ Return common ssh options (list or joined) """
+        settings = (
+            self.port,
+            tuple(self.key),
+            self.password,
+            tuple(self.ssh_option))
+        if self._cached_ssh_options is not None \
+                and self._cached_ssh_options[0] == settings:
+            return self._cached_ssh_options[1]
         options = [
             '-oForwardX11=no',
             '-oStrictHostKeyChecking=no',
@@ -617,7 +677,9 @@ class GuestSsh(Guest):
 
         options.extend([f'-o{option}' for option in self.ssh_option])
 
-        return Command(*options)
+        command = Command(*options)
+        self._cached_ssh_options = (settings, command)
+        return command
 
     def _ssh_master_connection(self, command: Command) -> None:
         """ Check/create the master ssh connection """
@@ -705,7 +767,7 @@ class GuestSsh(Guest):
 
         # Abort if guest is unavailable
         if self.guest is None:
-            if not self.opt('dry'):
+            if not self._dry:
                 raise tmt.utils.GeneralError('The guest is not available.')
 
         ssh_command: tmt.utils.Command = self._ssh_command()
@@ -724,22 +786,25 @@ class GuestSsh(Guest):
             ssh_command += Command('-tt')
 
         # Accumulate all necessary commands - they will form a "shell" script, a single
-        # string passed to SSH to execute on the remote machine.
-        remote_commands: ShellScript = ShellScript.from_scripts(
-            self._export_environment(self._prepare_environment(env))
-            )
+        # string passed to SSH to execute on the remote machine. Collect the pieces
+        # as plain strings and join them just once, repeated `ShellScript` addition
+        # would process the growing script again with every append.
+        script_parts: List[str] = [
+            str(script)
+            for script in self._export_environment(self._prepare_environment(env))
+            ]
 
         # Change to given directory on guest if cwd provided
         if cwd:
-            remote_commands += ShellScript(f'cd {quote(str(cwd))}')
+            script_parts.append(f'cd {quote(str(cwd))}')
 
         if isinstance(command, Command):
-            remote_commands += command.to_script()
+            script_parts.append(command.to_script().to_element())
 
         else:
-            remote_commands += command
+            script_parts.append(command.to_element())
 
-        remote_command = remote_commands.to_element()
+        remote_command = '; '.join(script_parts)
 
         ssh_command += [
             self._ssh_guest(),
@@ -774,7 +839,7 @@ class GuestSsh(Guest):
         """
         # Abort if guest is unavailable
         if self.guest is None:
-            if not self.opt('dry'):
+            if not self._dry:
                 raise tmt.utils.GeneralError('The guest is not available.')
 
         # Prepare options and the push command
@@ -838,7 +903,7 @@ class GuestSsh(Guest):
         """
         # Abort if guest is unavailable
         if self.guest is None:
-            if not self.opt('dry'):
+            if not self._dry:
                 raise tmt.utils.GeneralError('The guest is not available.')
 
         # Prepare options and the pull command
@@ -916,13 +981,50 @@ class GuestSsh(Guest):
             except OSError as error:
                 self.debug(f"Failed to remove the socket: {error}", level=3)
 
+    def reconnect(
+            self,
+            timeout: Optional[int] = None,
+            tick: float = RECONNECT_WAIT_TICK,
+            tick_increase: float = RECONNECT_WAIT_TICK_INCREASE
+            ) -> bool:
+        """
+        Ensure the connection to the guest is working
+
+        Before probing with a full ssh command, wait for the ssh port
+        to open - a plain TCP connect is much cheaper and can be
+        retried with a much shorter tick, so quickly recovering guests
+        are caught almost immediately.
+        """
+        timeout = timeout or CONNECTION_TIMEOUT
+
+        # Skip the port probe for tunneled connections, the guest
+        # address may not be directly reachable
+        if self.guest and not any('Proxy' in option for option in self.ssh_option):
+            self.debug("Wait for the ssh port to open.")
+            deadline = time.monotonic() + timeout
+            wait_tick = 0.1
+            while time.monotonic() < deadline:
+                try:
+                    with socket.create_connection(
+                            (self.guest, self.port or 22), timeout=1):
+                        break
+                except OSError:
+                    time.sleep(wait_tick)
+                    wait_tick = min(wait_tick * 2, tick)
+
+            # Leave at least one tick for the ssh probe below
+            timeout = max(int(deadline - time.monotonic()), int(tick) or 1)
+
+        return super().reconnect(
+            timeout=timeout, tick=tick, tick_increase=tick_increase)
+
     def reboot(
             self,
             hard: bool = False,
             command: Optional[Union[Command, ShellScript]] = None,
             timeout: Optional[int] = None,
             tick: float = tmt.utils.DEFAULT_WAIT_TICK,
-            tick_increase: float = tmt.utils.DEFAULT_WAIT_TICK_INCREASE) -> bool:
+            tick_increase: float = REBOOT_BACKOFF_FACTOR) -> bool:
         """
         Reboot the guest, return True if reconnect was successful
 
@@ -941,14 +1043,15 @@ class GuestSsh(Guest):
         command = command or Command("reboot")
         self.debug(f"Reboot using the command '{command}'.")
 
-        re_boot_time = re.compile(r'btime\s+(\d+)')
-
         def get_boot_time() -> int:
             """ Reads btime from /proc/stat """
-            stdout = self.execute(Command("cat", "/proc/stat")).stdout
+            # Fetch just the one line of interest, the poll loop below
+            # has no use for the rest of the file
+            stdout = self.execute(
+                Command("grep", "-m1", "^btime", "/proc/stat")).stdout
             assert stdout
 
-            match = re_boot_time.search(stdout)
+            match = _BOOT_TIME_PATTERN.search(stdout)
 
             if match is None:
                 raise tmt.utils.ProvisionError('Failed to retrieve boot time from guest')
@@ -969,38 +1072,32 @@ class GuestSsh(Guest):
                 raise
 
         # Wait until we get new boot time, connection will drop and will be
-        # unreachable for some time
-        def check_boot_time() -> None:
-            try:
-                new_boot_time = get_boot_time()
+        # unreachable for some time. Failed connection attempts back off
+        # by the tick_increase factor while the guest is down, a successful
+        # connection with an unchanged boot time resets the tick to its
+        # base value.
+        timeout = timeout or CONNECTION_TIMEOUT
+        deadline = time.monotonic() + timeout
+        current_tick = tick
 
-                if new_boot_time != current_boot_time:
+        while time.monotonic() < deadline:
+            try:
+                if get_boot_time() != current_boot_time:
                     # Different boot time and we are reconnected
-                    return
+                    self.debug("Connection to guest succeeded after reboot.")
+                    return True
 
                 # Same boot time, reboot didn't happen yet, retrying
-                raise tmt.utils.WaitingIncomplete()
+                current_tick = tick
 
             except tmt.utils.RunError:
                 self.debug('Failed to connect to the guest.')
-                raise tmt.utils.WaitingIncomplete()
-
-        timeout = timeout or CONNECTION_TIMEOUT
+                current_tick = min(current_tick * tick_increase, REBOOT_BACKOFF_CAP)
 
-        try:
-            tmt.utils.wait(
-                self,
-                check_boot_time,
-                datetime.timedelta(seconds=timeout),
-                tick=tick,
-                tick_increase=tick_increase)
-
-        except tmt.utils.WaitingTimedOutError:
-            self.debug("Connection to guest failed after reboot.")
-            return False
+            time.sleep(min(current_tick, max(deadline - time.monotonic(), 0)))
 
-        self.debug("Connection to guest succeeded after reboot.")
-        return True
+        self.debug("Connection to guest failed after reboot.")
+        return False
 
     def remove(self) -> None:
         """
@@ -1019,32 +1116,30 @@ class GuestSsh(Guest):
         Returns 'already installed' when rsync is already present.
         """
 
-        # Check for rsync (nothing to do if already installed)
+        # Check for rsync, the package manager and a read-only distro
+        # with a single command, each probe would cost a round trip
         self.debug("Ensure that rsync is installed on the guest.")
-        try:
-            self.execute(Command('rsync', '--version'))
+        output = self.execute(ShellScript(
+            'for tool in rsync dnf rpm-ostree; do '
+            'command -v "$tool" >/dev/null 2>&1 && echo "$tool"; '
+            'done; true'))
+        tools = (output.stdout or '').split()
+
+        # Nothing to do if already installed
+        if 'rsync' in tools:
             return CheckRsyncOutcome.ALREADY_INSTALLED
-        except tmt.utils.RunError:
-            pass
 
         # Check the package manager
-        self.debug("Check the package manager.")
-        try:
-            self.execute(Command('dnf', '--version'))
-            package_manager = "dnf"
-        except tmt.utils.RunError:
-            package_manager = "yum"
+        package_manager = "dnf" if 'dnf' in tools else "yum"
 
         # Install under '/root/pkg' for read-only distros
         # (for now the check is based on 'rpm-ostree' presence)
         # FIXME: Find a better way how to detect read-only distros
-        self.debug("Check for a read-only distro.")
-        try:
-            self.execute(Command('rpm-ostree', '--version'))
+        if 'rpm-ostree' in tools:
             readonly = (
                 " --installroot=/root/pkg --releasever / "
                 "&& ln -sf /root/pkg/bin/rsync /usr/local/bin/rsync")
-        except tmt.utils.RunError:
+        else:
             readonly = ""
 
         # Install the rsync
@@ -22,7 +22,7 @@ import unicodedata
 import urllib.parse
 from collections import OrderedDict
 from functools import lru_cache
-from threading import Thread
+from threading import Thread, local
 from typing import (IO, TYPE_CHECKING, Any, Callable, Dict, Generator, Generic,
                     Iterable, List, NamedTuple, Optional, Pattern, Sequence,
                     Tuple, Type, TypeVar, Union, cast, overload)
@@ -313,6 +313,8 @@ _CommandElement = str
 class ShellScript:
     """ A shell script, a free-form blob of text understood by a shell. """
 
+    __slots__ = ('_script',)
+
     def __init__(self, script: str) -> None:
         """
         A shell script, a free-form blob of text understood by a shell.
@@ -367,8 +369,12 @@ class ShellScript:
 class Command:
     """ A command with its arguments. """
 
+    __slots__ = ('_command', '_element_cache')
+
     def __init__(self, *elements: _CommandElement) -> None:
         self._command = elements
+        # Commands are immutable, quote the elements just once
+        self._element_cache: Optional[str] = None
 
     def __str__(self) -> str:
         return self.to_element()
@@ -388,7 +394,10 @@ class Command:
         would be would be ``rsync -e`` or ``ansible-playbook --ssh-common-args``.
         """
 
-        return ' '.join(shlex.quote(s) for s in self._command)
+        if self._element_cache is None:
+            self._element_cache = ' '.join(shlex.quote(s) for s in self._command)
+
+        return self._element_cache
 
     def to_script(self) -> ShellScript:
         """
@@ -397,7 +406,7 @@ class Command:
         Use when a command is supposed to become a part of a shell script.
         """
 
-        return ShellScript(' '.join(shlex.quote(s) for s in self._command))
+        return ShellScript(self.to_element())
 
     def to_popen(self) -> List[str]:
         """ Convert a command to form accepted by :py:mod:`subprocess.Popen` """
@@ -1581,13 +1590,26 @@ def context_to_dict(*, context: List[str], logger: tmt.log.Logger) -> FmfContext
         for key, value in environment_to_dict(variables=context, logger=logger).items()}
 
 
-def dict_to_yaml(
-        data: Union[Dict[str, Any], List[Any], 'tmt.base._RawFmfId'],
-        width: Optional[int] = None,
-        sort: bool = False,
-        start: bool = False) -> str:
-    """ Convert dictionary into yaml """
-    output = io.StringIO()
+# Configured YAML dumpers, reused across dict_to_yaml calls: building
+# a YAML instance and registering representers is surprisingly costly
+# when serializing many small documents. Dumpers are stateful, hence
+# cached per thread.
+_yaml_dumpers = local()
+
+
+def _yaml_dumper(width: Optional[int], start: bool) -> YAML:
+    """ Return a cached yaml dumper configured for given options """
+    cache: Dict[Tuple[Optional[int], bool], YAML]
+    try:
+        cache = _yaml_dumpers.cache
+    except AttributeError:
+        cache = _yaml_dumpers.cache = {}
+
+    key = (width, start)
+    dumper = cache.get(key)
+    if dumper is not None:
+        return dumper
+
     yaml = YAML()
     yaml.indent(mapping=4, sequence=4, offset=2)
     yaml.default_flow_style = False
@@ -1604,6 +1626,19 @@ def dict_to_yaml(
     yaml.representer.add_representer(pathlib.PosixPath, _represent_path)
     yaml.representer.add_representer(Path, _represent_path)
 
+    cache[key] = yaml
+    return yaml
+
+
+def dict_to_yaml(
+        data: Union[Dict[str, Any], List[Any], 'tmt.base._RawFmfId'],
+        width: Optional[int] = None,
+        sort: bool = False,
+        start: bool = False) -> str:
+    """ Convert dictionary into yaml """
+    output = io.StringIO()
+    yaml = _yaml_dumper(width, start)
+
     # Convert multiline strings
     scalarstring.walk_tree(data)
     if sort:
@@ -1622,11 +1657,30 @@ def dict_to_yaml(
 
 YamlTypType = Literal['rt', 'safe', 'unsafe', 'base']
 
+# Configured YAML loaders, reused across yaml_to_dict/yaml_to_list
+# calls just like the dumpers above - instantiating a loader is far
+# from free and step data or results are loaded document by document.
+_yaml_loaders = local()
+
+
+def _yaml_loader(yaml_type: Optional[YamlTypType]) -> YAML:
+    """ Return a cached yaml loader of the given type """
+    cache: Dict[Optional[YamlTypType], YAML]
+    try:
+        cache = _yaml_loaders.cache
+    except AttributeError:
+        cache = _yaml_loaders.cache = {}
+
+    loader = cache.get(yaml_type)
+    if loader is None:
+        loader = cache[yaml_type] = YAML(typ=yaml_type)
+    return loader
+
 
 def yaml_to_dict(data: Any,
                  yaml_type: Optional[YamlTypType] = None) -> Dict[Any, Any]:
     """ Convert yaml into dictionary """
-    yaml = YAML(typ=yaml_type)
+    yaml = _yaml_loader(yaml_type)
     loaded_data = yaml.load(data)
     if loaded_data is None:
         return dict()
@@ -1640,7 +1694,7 @@ def yaml_to_dict(data: Any,
 def yaml_to_list(data: Any,
                  yaml_type: Optional[YamlTypType] = 'safe') -> List[Any]:
     """ Convert yaml into list """
-    yaml = YAML(typ=yaml_type)
+    yaml = _yaml_loader(yaml_type)
     try:
         loaded_data = yaml.load(data)
     except ParserError as error:
@@ -1777,8 +1831,17 @@ class DataContainer:
     def keys(cls) -> Generator[str, None, None]:
         """ Iterate over key names """
 
-        for field in dataclasses.fields(cls):
-            yield field.name
+        # Cache the names in the class' own `__dict__` - dataclass
+        # reflection is not cheap, the list never changes, and
+        # subclasses must not inherit the cache of their parents.
+        # Stored via setattr() rather than a class-level annotation,
+        # key normalization iterates over annotations.
+        names = cast(Optional[Tuple[str, ...]], cls.__dict__.get('_field_names'))
+        if names is None:
+            names = tuple(field.name for field in dataclasses.fields(cls))
+            setattr(cls, '_field_names', names)
+
+        yield from names
 
     def values(self) -> Generator[Any, None, None]:
         """ Iterate over key values """